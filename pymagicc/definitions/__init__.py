@@ -19,7 +19,11 @@ from pathlib import Path
 import pandas as pd
 from pandas_datapackage_reader import read_datapackage
 
-from pymagicc.utils import apply_string_substitutions
+from pymagicc.utils import (
+    _check_duplicate_substitutions,
+    _compile_replacement_regexp,
+    apply_string_substitutions,
+)
 
 DATA_HIERARCHY_SEPARATOR = "|"
 """str: String used to define different levels in our data hierarchies.
@@ -754,6 +758,25 @@ MAGICC7_TO_MAGICC6_VARIABLES_MAPPING = get_magicc6_to_magicc7_variable_mapping(
 """
 
 
+def _get_case_insensitive_substitutions(mapping):
+    # build the substitution regexp and its (upper case) lookup table once rather
+    # than on every call, the mappings are fixed at import time
+    _check_duplicate_substitutions(mapping)
+
+    return (
+        _compile_replacement_regexp(mapping, case_insensitive=True),
+        {k.upper(): v for k, v in mapping.items()},
+    )
+
+
+_MAGICC6_TO_MAGICC7_VARIABLES_SUBSTITUTIONS = _get_case_insensitive_substitutions(
+    MAGICC6_TO_MAGICC7_VARIABLES_MAPPING
+)
+_MAGICC7_TO_MAGICC6_VARIABLES_SUBSTITUTIONS = _get_case_insensitive_substitutions(
+    MAGICC7_TO_MAGICC6_VARIABLES_MAPPING
+)
+
+
 @functools.lru_cache(None)
 def _apply_convert_magicc6_to_magicc7_variables(variables, inverse):
     def hfc245ca_included(variables):
@@ -767,19 +790,12 @@ def _apply_convert_magicc6_to_magicc7_variables(variables, inverse):
         warnings.warn(error_msg)
 
     if inverse:
-        return apply_string_substitutions(
-            variables,
-            MAGICC7_TO_MAGICC6_VARIABLES_MAPPING,
-            unused_substitutions="ignore",  # TODO: make this warn and see what happens
-            case_insensitive=True,  # MAGICC variables are case insensitive
-        )
+        regexp, substitutions = _MAGICC7_TO_MAGICC6_VARIABLES_SUBSTITUTIONS
     else:
-        return apply_string_substitutions(
-            variables,
-            MAGICC6_TO_MAGICC7_VARIABLES_MAPPING,
-            unused_substitutions="ignore",  # TODO: make this warn and see what happens
-            case_insensitive=True,  # MAGICC variables are case insensitive
-        )
+        regexp, substitutions = _MAGICC6_TO_MAGICC7_VARIABLES_SUBSTITUTIONS
+
+    # MAGICC variables are case insensitive
+    return regexp.sub(lambda x: substitutions[x.group(0).upper()], variables)
 
 
 def convert_magicc6_to_magicc7_variables(variables, inverse=False):
@@ -853,6 +869,14 @@ FORTRAN_SAFE_TO_PINT_UNITS_MAPPING = get_pint_to_fortran_safe_units_mapping(
 """
 
 
+@functools.lru_cache(None)
+def _apply_convert_pint_to_fortran_safe_units(units, inverse):
+    if inverse:
+        return apply_string_substitutions(units, FORTRAN_SAFE_TO_PINT_UNITS_MAPPING)
+    else:
+        return apply_string_substitutions(units, PINT_TO_FORTRAN_SAFE_UNITS_MAPPING)
+
+
 def convert_pint_to_fortran_safe_units(units, inverse=False):
     """
     Convert Pint units to Fortran safe units
@@ -870,7 +894,7 @@ def convert_pint_to_fortran_safe_units(units, inverse=False):
     ``type(units)``
         Set of converted units
     """
-    if inverse:
-        return apply_string_substitutions(units, FORTRAN_SAFE_TO_PINT_UNITS_MAPPING)
-    else:
-        return apply_string_substitutions(units, PINT_TO_FORTRAN_SAFE_UNITS_MAPPING)
+    if isinstance(units, str):
+        return _apply_convert_pint_to_fortran_safe_units(units, inverse)
+
+    return [_apply_convert_pint_to_fortran_safe_units(u, inverse) for u in units]
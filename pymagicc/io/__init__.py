@@ -1,3 +1,4 @@
+import functools
 import re
 from copy import deepcopy
 from datetime import datetime
@@ -72,12 +73,111 @@ Some more details about why these files are not supported:
 """
 
 
-def _unsupported_file(filepath):
-    for outfile in UNSUPPORTED_OUT_FILES:
-        if re.match(outfile, filepath):
-            return True
+_FILE_REGEXP_READER_WRITER = {
+    "SCEN": {"regexp": r"^.*\.SCEN$", "reader": _ScenReader, "writer": _ScenWriter},
+    "SCEN7": {
+        "regexp": r"^.*\.SCEN7$",
+        "reader": _Scen7Reader,
+        "writer": _Scen7Writer,
+    },
+    "prn": {"regexp": r"^.*\.prn$", "reader": _PrnReader, "writer": _PrnWriter},
+    # "Sector": {"regexp": r".*\.SECTOR$", "reader": _Scen7Reader, "writer": _Scen7Writer},
+    "EmisIn": {
+        "regexp": r"^.*\_EMIS.*\.IN$",
+        "reader": _HistEmisInReader,
+        "writer": _HistEmisInWriter,
+    },
+    "ConcIn": {
+        "regexp": r"^.*\_CONC.*\.IN$",
+        "reader": _ConcInReader,
+        "writer": _ConcInWriter,
+    },
+    "OpticalThicknessIn": {
+        "regexp": r"^.*\_OT\.IN$",
+        "reader": _OpticalThicknessInReader,
+        "writer": _OpticalThicknessInWriter,
+    },
+    "RadiativeForcingIn": {
+        "regexp": r"^.*\_RF\.(IN|MON)$",
+        "reader": _RadiativeForcingInReader,
+        "writer": _RadiativeForcingInWriter,
+    },
+    "SurfaceTemperatureIn": {
+        "regexp": r"^.*SURFACE\_TEMP\.(IN|MON)$",
+        "reader": _SurfaceTemperatureInReader,
+        "writer": _SurfaceTemperatureInWriter,
+    },
+    "Out": {
+        "regexp": r"^DAT\_.*(?<!EMIS)\.OUT$",
+        "reader": _OutReader,
+        "writer": None,
+    },
+    "EmisOut": {
+        "regexp": r"^DAT\_.*EMIS\.OUT$",
+        "reader": _EmisOutReader,
+        "writer": None,
+    },
+    "InverseEmis": {
+        "regexp": r"^INVERSEEMIS\.OUT$",
+        "reader": _InverseEmisReader,
+        "writer": None,
+    },
+    "TempOceanLayersOut": {
+        "regexp": r"^TEMP\_OCEANLAYERS.*\.OUT$",
+        "reader": _TempOceanLayersOutReader,
+        "writer": None,
+    },
+    "BinOut": {
+        "regexp": r"^DAT\_.*\.BINOUT$",
+        "reader": _BinaryOutReader,
+        "writer": None,
+    },
+    "RCPData": {
+        "regexp": r"^.*\.DAT",
+        "reader": _RCPDatReader,
+        "writer": _RCPDatWriter,
+    },
+    "CompactOut": {
+        "regexp": r"^.*COMPACT\.OUT$",
+        "reader": _CompactOutReader,
+        "writer": None,
+    },
+    "CompactBinOut": {
+        "regexp": r"^.*COMPACT\.BINOUT$",
+        "reader": _BinaryCompactOutReader,
+        "writer": None,
+    },
+    "MAG": {"regexp": r"^.*\.MAG", "reader": _MAGReader, "writer": _MAGWriter},
+    # "InverseEmisOut": {"regexp": r"^INVERSEEMIS\_.*\.OUT$", "reader": _Scen7Reader, "writer": _Scen7Writer},
+}
+"""dict: Regular expressions, readers and writers for each supported file type"""
+
+_FILE_REGEXPS_COMPILED = [
+    (re.compile(file_tools["regexp"]), file_tools)
+    for file_tools in _FILE_REGEXP_READER_WRITER.values()
+]
+"""list: Compiled regular expressions and tools in the order they are checked"""
+
+
+_UNSUPPORTED_OUT_FILES_REGEXP = re.compile(
+    "|".join(["(?:{})".format(r) for r in UNSUPPORTED_OUT_FILES])
+)
+"""re.Pattern: Single regular expression matching any of ``UNSUPPORTED_OUT_FILES``"""
 
-    return False
+
+@functools.lru_cache(512)
+def _get_file_tools(fbase):
+    # the same few file names are looked up over and over (e.g. every time MAGICC's
+    # output is read) so remember which regexp matched rather than re-scanning
+    for file_regexp, file_tools in _FILE_REGEXPS_COMPILED:
+        if file_regexp.match(fbase):
+            return file_tools
+
+    return None
+
+
+def _unsupported_file(filepath):
+    return _UNSUPPORTED_OUT_FILES_REGEXP.match(filepath) is not None
 
 
 def determine_tool(filepath, tool_to_get):
@@ -113,84 +213,6 @@ def determine_tool(filepath, tool_to_get):
         The tool to get, valid options are "reader", "writer".
         Invalid values will throw a NoReaderWriterError.
     """
-    file_regexp_reader_writer = {
-        "SCEN": {"regexp": r"^.*\.SCEN$", "reader": _ScenReader, "writer": _ScenWriter},
-        "SCEN7": {
-            "regexp": r"^.*\.SCEN7$",
-            "reader": _Scen7Reader,
-            "writer": _Scen7Writer,
-        },
-        "prn": {"regexp": r"^.*\.prn$", "reader": _PrnReader, "writer": _PrnWriter},
-        # "Sector": {"regexp": r".*\.SECTOR$", "reader": _Scen7Reader, "writer": _Scen7Writer},
-        "EmisIn": {
-            "regexp": r"^.*\_EMIS.*\.IN$",
-            "reader": _HistEmisInReader,
-            "writer": _HistEmisInWriter,
-        },
-        "ConcIn": {
-            "regexp": r"^.*\_CONC.*\.IN$",
-            "reader": _ConcInReader,
-            "writer": _ConcInWriter,
-        },
-        "OpticalThicknessIn": {
-            "regexp": r"^.*\_OT\.IN$",
-            "reader": _OpticalThicknessInReader,
-            "writer": _OpticalThicknessInWriter,
-        },
-        "RadiativeForcingIn": {
-            "regexp": r"^.*\_RF\.(IN|MON)$",
-            "reader": _RadiativeForcingInReader,
-            "writer": _RadiativeForcingInWriter,
-        },
-        "SurfaceTemperatureIn": {
-            "regexp": r"^.*SURFACE\_TEMP\.(IN|MON)$",
-            "reader": _SurfaceTemperatureInReader,
-            "writer": _SurfaceTemperatureInWriter,
-        },
-        "Out": {
-            "regexp": r"^DAT\_.*(?<!EMIS)\.OUT$",
-            "reader": _OutReader,
-            "writer": None,
-        },
-        "EmisOut": {
-            "regexp": r"^DAT\_.*EMIS\.OUT$",
-            "reader": _EmisOutReader,
-            "writer": None,
-        },
-        "InverseEmis": {
-            "regexp": r"^INVERSEEMIS\.OUT$",
-            "reader": _InverseEmisReader,
-            "writer": None,
-        },
-        "TempOceanLayersOut": {
-            "regexp": r"^TEMP\_OCEANLAYERS.*\.OUT$",
-            "reader": _TempOceanLayersOutReader,
-            "writer": None,
-        },
-        "BinOut": {
-            "regexp": r"^DAT\_.*\.BINOUT$",
-            "reader": _BinaryOutReader,
-            "writer": None,
-        },
-        "RCPData": {
-            "regexp": r"^.*\.DAT",
-            "reader": _RCPDatReader,
-            "writer": _RCPDatWriter,
-        },
-        "CompactOut": {
-            "regexp": r"^.*COMPACT\.OUT$",
-            "reader": _CompactOutReader,
-            "writer": None,
-        },
-        "CompactBinOut": {
-            "regexp": r"^.*COMPACT\.BINOUT$",
-            "reader": _BinaryCompactOutReader,
-            "writer": None,
-        },
-        "MAG": {"regexp": r"^.*\.MAG", "reader": _MAGReader, "writer": _MAGWriter},
-        # "InverseEmisOut": {"regexp": r"^INVERSEEMIS\_.*\.OUT$", "reader": _Scen7Reader, "writer": _Scen7Writer},
-    }
-
     fbase = basename(filepath)
     if _unsupported_file(fbase):
         raise NoReaderWriterError(
@@ -199,25 +221,25 @@ def determine_tool(filepath, tool_to_get):
             )
         )
 
-    for file_type, file_tools in file_regexp_reader_writer.items():
-        if re.match(file_tools["regexp"], fbase):
-            try:
-                tool = file_tools[tool_to_get]
-                if tool is None:
-                    error_msg = "A {} for `{}` files is not yet implemented".format(
-                        tool_to_get, file_tools["regexp"]
-                    )
-                    raise NotImplementedError(error_msg)
+    file_tools = _get_file_tools(fbase)
+    if file_tools is not None:
+        try:
+            tool = file_tools[tool_to_get]
+            if tool is None:
+                error_msg = "A {} for `{}` files is not yet implemented".format(
+                    tool_to_get, file_tools["regexp"]
+                )
+                raise NotImplementedError(error_msg)
 
-                return tool
+            return tool
 
-            except KeyError:
-                valid_tools = [k for k in file_tools.keys() if k != "regexp"]
-                error_msg = (
-                    "MAGICCData does not know how to get a {}, "
-                    "valid options are: {}".format(tool_to_get, valid_tools)
-                )
-                raise KeyError(error_msg)
+        except KeyError:
+            valid_tools = [k for k in file_tools.keys() if k != "regexp"]
+            error_msg = (
+                "MAGICCData does not know how to get a {}, "
+                "valid options are: {}".format(tool_to_get, valid_tools)
+            )
+            raise KeyError(error_msg)
 
     para_file = "PARAMETERS.OUT"
     if (filepath.endswith(".CFG")) and (tool_to_get == "reader"):
@@ -236,7 +258,7 @@ def determine_tool(filepath, tool_to_get):
         regexp_list_str = "\n".join(
             [
                 "{}: {}".format(k, v["regexp"])
-                for k, v in file_regexp_reader_writer.items()
+                for k, v in _FILE_REGEXP_READER_WRITER.items()
             ]
         )
         error_msg = (
@@ -28,6 +28,50 @@ from .utils import (
     get_region_order,
 )
 
+_NML_SIMPLE_LINE_REGEXP = re.compile(
+    r"^\s*([A-Za-z]\w*)\s*=\s*"
+    r"(?:'([^']*)'|\"([^\"]*)\"|([-+]?\d+)|([-+]?(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"|((?:W/m|[A-Za-z])[\w^]*))"
+    r"\s*,?\s*$"
+)
+"""
+:obj:`re.Pattern`: Matches a namelist line of the form ``KEY = value`` where value is
+a quoted string, an integer, a float or a single unquoted word
+"""
+
+_NML_UNQUOTED_NON_STRINGS = frozenset(
+    ["t", "f", "true", "false", "nan", "inf", "infinity"]
+)
+"""
+frozenset: Lower case unquoted words which f90nml reads as logicals or floats rather
+than strings
+"""
+
+_EMISSIONS_MASS_PREFIX_REGEXP = re.compile("Gt|Mt|kt|t|Pg|Gg|Mg|kg|g")
+"""
+:obj:`re.Pattern`: Matches the mass prefix of an emissions unit, alternatives are
+tried in order so e.g. ``Gt`` wins over ``g``
+"""
+
+_EMISSIONS_PER_YEAR_REGEXP = re.compile(r"(\S)\s?/\s?yr", re.ASCII)
+"""
+:obj:`re.Pattern`: Matches a per year suffix so it can be normalised to `` / yr``
+"""
+
+_REQUIRED_COLUMNS_ORDER = (
+    "variable",
+    "todo",
+    "unit",
+    "region",
+    "climate_model",
+    "model",
+    "scenario",
+)
+"""tuple: Columns every reader must provide, in the order they are checked"""
+
+_REQUIRED_COLUMNS = frozenset(_REQUIRED_COLUMNS_ORDER)
+"""frozenset: Set of columns every reader must provide"""
+
 
 class _Reader(object):
     header_tags = [
@@ -45,7 +89,19 @@ class _Reader(object):
     ]
     _newline_char = "\n"
     _variable_line_keyword = "VARIABLE"
+    _magicc_region_mapping = {
+        "GLOBAL": "GLOBAL",
+        "NO": "NHOCEAN",
+        "SO": "SHOCEAN",
+        "NL": "NHLAND",
+        "SL": "SHLAND",
+        "NH-OCEAN": "NHOCEAN",
+        "SH-OCEAN": "SHOCEAN",
+        "NH-LAND": "NHLAND",
+        "SH-LAND": "SHLAND",
+    }
     _regexp_capture_variable = None
+    _regexp_capture_unit = re.compile(r".*\((.*)\)\s*$", re.ASCII)
     _default_todo_fill_value = "SET"
 
     def __init__(self, filepath):
@@ -57,12 +113,7 @@ class _Reader(object):
         metadata = self._derive_metadata(nml_start, nml_end)
 
         # Create a stream from the remaining lines, ignoring any blank lines
-        stream = StringIO()
-        cleaned_lines = [
-            line.strip() for line in self.lines[nml_end + 1 :] if line.strip()
-        ]
-        stream.write("\n".join(cleaned_lines))
-        stream.seek(0)
+        stream = self._get_stream_without_blank_lines(self.lines[nml_end + 1 :])
 
         df, metadata, column_headers = self.process_data(stream, metadata)
 
@@ -75,18 +126,27 @@ class _Reader(object):
         # only work if the encoding is utf-8.
         return open(self.filepath, "r", encoding="utf-8", newline=self._newline_char)
 
-    def _readlines(self, fh, metadata_only=False):
-        if metadata_only:
-            # read file line by line
-            line = None
-            while line != "":
-                line = fh.readline()
-                yield line
+    def _readlines(self, fh):
+        # read file line by line
+        line = None
+        while line != "":
+            line = fh.readline()
+            yield line
 
-        else:
-            # read whole file at once
-            for line in fh.readlines():
-                yield line
+    def _read_file(self, fh):
+        # Read the whole file at once, keeping the raw text too so it can be
+        # searched without going back to disk. As the file is opened with
+        # ``newline=self._newline_char``, no newlines are translated so joining the
+        # lines gives exactly the file's contents.
+        lines = fh.readlines()
+        self._raw = "".join(lines)
+
+        return lines
+
+    @staticmethod
+    def _get_stream_without_blank_lines(lines):
+        # strip each line only once and let filter drop the empty ones, both in C
+        return StringIO("\n".join(filter(None, map(str.strip, lines))))
 
     def _set_lines_and_find_nml(self, metadata_only=False):
         """
@@ -106,18 +166,25 @@ class _Reader(object):
         nml_start = None
         nml_end = None
         with self._open_file() as f:
-            lines = []
+            if metadata_only:
+                lines = []
+                line_iter = self._readlines(f)
+            else:
+                lines = self._read_file(f)
+                line_iter = iter(lines)
 
-            for i, line in enumerate(self._readlines(f, metadata_only=metadata_only)):
-                lines.append(line)
+            # the namelist comes before the data block so we can stop looking as
+            # soon as we find its end, rather than checking every line of data
+            for i, line in enumerate(line_iter):
+                if metadata_only:
+                    lines.append(line)
 
                 if self._is_nml_start(line):
                     nml_start = i
 
                 if (nml_start is not None) and self._is_nml_end(line):
                     nml_end = i
-                    if metadata_only:
-                        break
+                    break
 
         self.lines = lines
 
@@ -144,12 +211,58 @@ class _Reader(object):
             for key, value in nml_values.items()
             if key in ["units", "timeseriestype"]
         }
-        header_metadata = self.process_header("".join(self.lines[:nml_start]))
+        header_metadata = self._process_header_lines(self.lines[:nml_start])
         metadata.update(header_metadata)
 
         return metadata
 
     def process_metadata(self, lines):
+        # THISFILE_SPECIFICATIONS is almost always a handful of simple
+        # ``KEY = value`` lines, for which tokenising with f90nml is overkill. If
+        # anything doesn't fit that pattern (e.g. unquoted strings, which f90nml
+        # treats in its own special way), we fall back to f90nml.
+        metadata = {}
+        for line in lines:
+            if not line.strip() or self._is_nml_start(line) or self._is_nml_end(line):
+                continue
+
+            match = _NML_SIMPLE_LINE_REGEXP.match(line)
+            if match is None:
+                return self._process_metadata_f90nml(lines)
+
+            (
+                key,
+                single_quoted,
+                double_quoted,
+                int_value,
+                float_value,
+                unquoted,
+            ) = match.groups()
+            metadata_key = key.lower().split("_")[1]
+            if metadata_key in metadata:
+                return self._process_metadata_f90nml(lines)
+
+            if int_value is not None:
+                metadata[metadata_key] = int(int_value)
+            elif float_value is not None:
+                metadata[metadata_key] = float(float_value)
+            elif unquoted is not None and unquoted.lower() in _NML_UNQUOTED_NON_STRINGS:
+                return self._process_metadata_f90nml(lines)
+            else:
+                if unquoted is not None:
+                    value = unquoted
+                elif single_quoted is not None:
+                    value = single_quoted
+                else:
+                    value = double_quoted
+                # mirror the edge case round trip made when reading with f90nml
+                metadata[metadata_key] = apply_string_substitutions(
+                    value, {"W/m": "Wperm", "^": "superscript"}, inverse=True
+                ).strip()
+
+        return metadata
+
+    def _process_metadata_f90nml(self, lines):
         def preprocess_edge_cases(lines, inverse=False):
             replacements = {"W/m": "Wperm", "^": "superscript"}
 
@@ -222,22 +335,56 @@ class _Reader(object):
         :obj:`pd.DataFrame`
             Dataframe with processed datablock
         """
-        df = pd.read_csv(
-            stream,
-            skip_blank_lines=True,
-            delim_whitespace=True,
-            header=None,
-            index_col=0,
-        )
+        data_block = stream.read()
+        try:
+            df = self._convert_numeric_data_block_to_df(data_block)
+        except ValueError:
+            # not a simple numeric block (e.g. ragged rows or missing value
+            # markers), let pandas deal with it
+            df = pd.read_csv(
+                StringIO(data_block),
+                skip_blank_lines=True,
+                delim_whitespace=True,
+                header=None,
+                index_col=0,
+                # parse floats exactly as ``float`` does, like the numeric path
+                # above, so a value doesn't change depending on which path reads it
+                float_precision="round_trip",
+            )
 
-        if isinstance(df.index, pd.core.indexes.numeric.Float64Index):
-            df.index = df.index.to_series().round(3)
+        if df.index.dtype.kind == "f":
+            df.index = pd.Index(np.round(df.index.values, 3), name=df.index.name)
 
         # reset the columns to be 0..n instead of starting at 1
         df.columns = list(range(len(df.columns)))
 
         return df
 
+    @staticmethod
+    def _convert_numeric_data_block_to_df(data_block):
+        # The data blocks we read are whitespace separated, rectangular and purely
+        # numeric so we can skip pandas' csv machinery and convert the tokens in
+        # one go. A ValueError is raised if this assumption doesn't hold.
+        rows = [line.split() for line in data_block.splitlines()]
+        rows = [row for row in rows if row]
+        if not rows:
+            raise ValueError("Data block is empty")
+
+        n_cols = len(rows[0])
+        if any(len(row) != n_cols for row in rows):
+            raise ValueError("Data block is not rectangular")
+
+        data = np.array(rows, dtype=float)
+
+        index_tokens = [row[0] for row in rows]
+        try:
+            # like pandas, keep integer time axes as integers
+            index = pd.Index(np.array(index_tokens).astype(np.int64))
+        except ValueError:
+            index = pd.Index(data[:, 0])
+
+        return pd.DataFrame(data[:, 1:], index=index)
+
     def _convert_to_string_columns(self, df):
         for categorical_column in [
             "variable",
@@ -258,18 +405,14 @@ class _Reader(object):
         ch.setdefault("model", "unspecified")
         ch.setdefault("scenario", "unspecified")
 
-        required_cols = [
-            "variable",
-            "todo",
-            "unit",
-            "region",
-            "climate_model",
-            "model",
-            "scenario",
-        ]
-        for col in required_cols:
-            if col not in ch:
-                raise AssertionError("Missing column {}".format(col))
+        missing_cols = _REQUIRED_COLUMNS.difference(ch)
+        if missing_cols:
+            # report the first missing column in a stable order
+            raise AssertionError(
+                "Missing column {}".format(
+                    min(missing_cols, key=_REQUIRED_COLUMNS_ORDER.index)
+                )
+            )
 
         return ch
 
@@ -281,7 +424,7 @@ class _Reader(object):
             column_headers, metadata = self._read_magicc6_style_header(stream, metadata)
 
         column_headers["variable"] = convert_magicc7_to_openscm_variables(
-            column_headers["variable"]
+            self._normalise_variables(column_headers["variable"])
         )
         column_headers["region"] = convert_magicc_to_openscm_regions(
             column_headers["region"]
@@ -289,10 +432,27 @@ class _Reader(object):
 
         return column_headers, metadata
 
+    def _normalise_variables(self, variables):
+        """
+        Tidy the MAGICC7 variables read from the header before they are converted
+
+        Parameters
+        ----------
+        variables : list of str
+            MAGICC7 variables read from the header
+
+        Returns
+        -------
+        list of str
+            MAGICC7 variables ready for conversion to OpenSCM variables
+        """
+        return variables
+
     def _magicc7_style_header(self):
-        return any(["TODO" in line for line in self.lines]) and any(
-            ["UNITS" in line for line in self.lines]
-        )
+        # neither keyword can span lines so we can search all the lines at once
+        # rather than checking each line in turn
+        text = "".join(self.lines)
+        return ("TODO" in text) and ("UNITS" in text)
 
     def _read_magicc7_style_header(self, stream, metadata):
         # Note that regions header line is assumed to start with 'YEARS'
@@ -316,16 +476,10 @@ class _Reader(object):
         # or 'YEARS' instead of 'REGIONS'
         regions = self._read_data_header_line(stream, ["COLCODE", "YEARS"])
 
-        try:
-            unit = metadata["unit"]
-            metadata.pop("unit")
-        except KeyError:
-            unit = metadata["units"]
-            metadata.pop("units")
+        unit = metadata.pop("unit") if "unit" in metadata else metadata.pop("units")
 
         if "(" in unit:
-            regexp_capture_unit = re.compile(r".*\((.*)\)\s*$")
-            unit = regexp_capture_unit.search(unit).group(1)
+            unit = self._regexp_capture_unit.search(unit).group(1)
 
         variable = convert_magicc6_to_magicc7_variables(
             self._get_variable_from_filepath()
@@ -338,10 +492,7 @@ class _Reader(object):
         }
 
         for k in ["unit", "units", "gas"]:
-            try:
-                metadata.pop(k)
-            except KeyError:
-                pass
+            metadata.pop(k, None)
 
         return column_headers, metadata
 
@@ -354,11 +505,18 @@ class _Reader(object):
         str
             Best guess of variable name from the filepath
         """
-        try:
-            return self.regexp_capture_variable.search(self.filepath).group(1)
-        except AttributeError:
+        # read the class attribute directly rather than through the
+        # ``regexp_capture_variable`` property, this is called for every file read
+        regexp_capture_variable = self._regexp_capture_variable
+        if regexp_capture_variable is None:
+            raise NotImplementedError()
+
+        match = regexp_capture_variable.search(self.filepath)
+        if match is None:
             self._raise_cannot_determine_variable_from_filepath_error()
 
+        return match.group(1)
+
     @property
     def regexp_capture_variable(self):
         if self._regexp_capture_variable is None:
@@ -378,17 +536,34 @@ class _Reader(object):
         header : str
             All the lines in the header.
 
+        Returns
+        -------
+        dict
+            The metadata in the header.
+        """
+        return self._process_header_lines(header.split("\n"))
+
+    def _process_header_lines(self, lines):
+        """
+        Parse the header for additional metadata.
+
+        Parameters
+        ----------
+        lines : list of str
+            The lines in the header, with or without trailing newlines.
+
         Returns
         -------
         dict
             The metadata in the header.
         """
         metadata = {}
+        header_tags = frozenset(self.header_tags)
         # assume we start in header in case we are looking at legacy file which
         # doesn't have the '---- HEADER ----' line
         in_header = True
         header_lines = []
-        for line in header.split("\n"):
+        for line in lines:
             line = line.strip()
             if not line:
                 continue
@@ -398,11 +573,13 @@ class _Reader(object):
                 in_header = False
             else:
                 if in_header:
-                    for tag in self.header_tags:
-                        tag_text = "{}:".format(tag)
-                        if line.lower().startswith(tag_text):
-                            metadata[tag] = line[len(tag_text) + 1 :].strip()
-                            break
+                    # tags can't contain a colon so the tag, if any, is everything
+                    # before the first colon
+                    tag, sep, value = line.partition(":")
+                    tag = tag.lower()
+                    if sep and tag in header_tags:
+                        # the character straight after the colon is always dropped
+                        metadata[tag] = value[1:].strip()
                     else:
                         header_lines.append(line)
                 else:
@@ -434,39 +611,20 @@ class _Reader(object):
         expected_header = (
             [expected_header] if isinstance(expected_header, str) else expected_header
         )
-        for exp_hd in expected_header:
-            tokens = stream.readline().split()
-            try:
-                if not tokens[0] == exp_hd:
-                    raise AssertionError(
-                        "Token '{}' does not match expected header "
-                        "'{}'".format(tokens[0], exp_hd)
-                    )
-
-                return tokens[1:]
-
-            except AssertionError:
-                stream.seek(pos)
-                continue
+        # read the line once and check its first token against all the headers,
+        # an empty line raises an IndexError which callers rely on
+        tokens = stream.readline().split()
+        if tokens[0] in expected_header:
+            return tokens[1:]
 
+        stream.seek(pos)
         assertion_msg = "Expected a header token of {}, got {}".format(
             expected_header, tokens[0]
         )
         raise AssertionError(assertion_msg)
 
     def _unify_magicc_regions(self, regions):
-        region_mapping = {
-            "GLOBAL": "GLOBAL",
-            "NO": "NHOCEAN",
-            "SO": "SHOCEAN",
-            "NL": "NHLAND",
-            "SL": "SHLAND",
-            "NH-OCEAN": "NHOCEAN",
-            "SH-OCEAN": "SHOCEAN",
-            "NH-LAND": "NHLAND",
-            "SH-LAND": "SHLAND",
-        }
-        return [region_mapping[r] for r in regions]
+        return [self._magicc_region_mapping[r] for r in regions]
 
     def _read_units(self, column_headers):
         column_headers["unit"] = convert_pint_to_fortran_safe_units(
@@ -500,18 +658,18 @@ class _EmisInReader(_Reader):
 
         units = column_headers["unit"]
         variables = column_headers["variable"]
+        mass = None
         for i, (unit, variable) in enumerate(zip(units, variables)):
             unit = unit.replace("-", "")
-            for tmass in ["Gt", "Mt", "kt", "t", "Pg", "Gg", "Mg", "kg", "g"]:
-                if unit.startswith(tmass):
-                    mass = tmass
-                    break
+            mass_match = _EMISSIONS_MASS_PREFIX_REGEXP.match(unit)
+            if mass_match is not None:
+                mass = mass_match.group(0)
 
-            try:
-                emissions_unit = unit.replace(mass, "")
-            except NameError:
+            if mass is None:
                 raise ValueError("Unexpected emissions unit")
 
+            emissions_unit = unit.replace(mass, "")
+
             if not emissions_unit or emissions_unit.replace(" ", "") == "/yr":
                 emissions_unit = variable.split(DATA_HIERARCHY_SEPARATOR)[-1]
                 if emissions_unit in ["MAGICC AFOLU", "MAGICC Fossil and Industrial"]:
@@ -521,7 +679,9 @@ class _EmisInReader(_Reader):
                 # TODO: think of a way to not have to assume years...
                 emissions_unit = "{} / yr".format(emissions_unit)
             else:
-                emissions_unit = re.sub(r"(\S)\s?/\s?yr", r"\1 / yr", emissions_unit)
+                emissions_unit = _EMISSIONS_PER_YEAR_REGEXP.sub(
+                    r"\1 / yr", emissions_unit
+                )
 
             units[i] = "{} {}".format(mass.strip(), emissions_unit.strip())
             variables[i] = variable
@@ -571,13 +731,25 @@ class _Writer(object):
         # TODO: make copy attribute for MAGICCData
         self.minput = deepcopy(magicc_input)
         self.data_block = self._get_data_block()
+        # the header rows are needed by several of the writing steps so they are all
+        # derived once, here, in a single pass over the columns
+        columns = self.data_block.columns
+        if isinstance(columns, pd.MultiIndex):
+            header_rows = list(zip(*columns.tolist())) or [()] * columns.nlevels
+        else:
+            header_rows = [columns.tolist()]
+
+        self._data_block_header_rows = {
+            name: list(header_row)
+            for name, header_row in zip(columns.names, header_rows)
+        }
+        # the namelist and datablock are tightly coupled so are only derived once,
+        # when first needed, and then shared by the namelist and datablock writers
+        self._nml_and_data_block = None
 
         output = StringIO()
 
         output = self._write_header(output)
-        # TODO: fix this logic. The datablock and the namelist are tightly coupled so
-        # they should be written together too. At the moment the datablock is
-        # generated twice which is not fast (I suspect, haven't actually checked).
         output = self._write_namelist(output)
         output = self._write_datablock(output)
 
@@ -591,6 +763,16 @@ class _Writer(object):
         output.write(self._get_header())
         return output
 
+    def _write_lines(self, output, lines):
+        # equivalent to ``output.write(self._newline_char.join(lines))`` without
+        # building the whole file as one more string first
+        for i, line in enumerate(lines):
+            if i:
+                output.write(self._newline_char)
+            output.write(line)
+
+        return output
+
     def _get_header(self):
         try:
             header = self.minput.metadata.pop("header")
@@ -615,8 +797,8 @@ class _Writer(object):
         )
 
     def _write_namelist(self, output):
-        nml_initial, data_block = self._get_initial_nml_and_data_block()
-        nml = nml_initial.copy()
+        nml_initial, data_block = self._get_nml_and_data_block()
+        nml = deepcopy(nml_initial)
 
         # '&NML_INDICATOR' goes above, '/'' goes at end
         number_lines_nml_header_end = 2
@@ -638,7 +820,8 @@ class _Writer(object):
             nml["THISFILE_SPECIFICATIONS"].pop("THISFILE_DATAROWS")
 
         nml["THISFILE_SPECIFICATIONS"]["THISFILE_FIRSTDATAROW"] = (
-            len(output.getvalue().split(self._newline_char))
+            output.getvalue().count(self._newline_char)
+            + 1
             + len(nml["THISFILE_SPECIFICATIONS"])
             + number_lines_nml_header_end
             + len(line_after_nml.split(self._newline_char))
@@ -652,7 +835,7 @@ class _Writer(object):
         return output
 
     def _write_datablock(self, output):
-        _, data_block = self._get_initial_nml_and_data_block()
+        _, data_block = self._get_nml_and_data_block()
 
         # for most data files, as long as the data is space separated, the
         # format doesn't matter
@@ -663,42 +846,118 @@ class _Writer(object):
         else:
             time_col_format = "f"
 
-        first_col_format_str = (
-            "{" + ":{}{}".format(time_col_length, time_col_format) + "}"
-        ).format
-        other_col_format_str = "{:19.5e}".format
-        formatters = [other_col_format_str] * len(data_block.columns)
-        formatters[0] = first_col_format_str
+        first_col_format = "{}{}".format(time_col_length, time_col_format)
+        other_col_format = "19.5e"
+        col_formats = [first_col_format] + [other_col_format] * (
+            len(data_block.columns) - 1
+        )
 
-        data_block.to_string(output, index=False, formatters=formatters, sparsify=False)
+        output.write(self._format_data_block(data_block, col_formats))
 
         output.write(self._newline_char)
         return output
 
+    @staticmethod
+    def _format_data_block(data_block, col_formats, header=True):
+        """
+        Format a data block (with its column header rows) as a string
+
+        This gives the same result as ``data_block.to_string(index=False)`` with
+        each column formatted by its entry in ``col_formats``.
+
+        Parameters
+        ----------
+        data_block : :obj:`pd.DataFrame`
+            Data block to format, its first column is the time column
+
+        col_formats : list of str
+            Format spec of each column e.g. ``["11d", "19.5e", "19.5e"]``
+
+        header : bool
+            Should the column header rows be written?
+
+        Returns
+        -------
+        str
+            Formatted data block
+        """
+        # Formatting row by row with a single format string is much quicker than
+        # ``to_string``, which calls a formatter for every cell. Each column is as
+        # wide as the widest of its headers and its formatted values, with
+        # everything right justified. If a value overflows its column, ``to_string``
+        # pads the whole column so we fall back to it (as we do for anything else
+        # unexpected).
+        other_cols = len(data_block.columns) - 1
+        time_col = data_block.iloc[:, 0]
+        if (
+            len(col_formats) == other_cols + 1
+            and (not header or isinstance(data_block.columns, pd.MultiIndex))
+            and (col_formats[0].endswith("f") or time_col.dtype.kind == "i")
+        ):
+            header_rows = list(zip(*data_block.columns.tolist())) if header else []
+            col_widths = [len(("%" + f) % 0) for f in col_formats]
+            for header_row in header_rows:
+                col_widths = [
+                    max(w, len(str(h))) for w, h in zip(col_widths, header_row)
+                ]
+
+            # widen the formats so that values are padded to the header width
+            line_format = " ".join(
+                [
+                    "%{}{}".format(w, re.sub(r"^\d+", "", f))
+                    for f, w in zip(col_formats, col_widths)
+                ]
+            )
+            line_length = sum(col_widths) + other_cols
+
+            lines = [
+                " ".join([str(h).rjust(w) for h, w in zip(header_row, col_widths)])
+                for header_row in header_rows
+            ]
+            lines += [
+                line_format % tuple([time] + values)
+                for time, values in zip(
+                    time_col.tolist(), data_block.iloc[:, 1:].values.tolist()
+                )
+            ]
+            if all([len(line) == line_length for line in lines]):
+                return "\n".join(lines)
+
+        formatters = [("{:" + f + "}").format for f in col_formats]
+
+        return data_block.to_string(
+            index=False, header=header, formatters=formatters, sparsify=False
+        )
+
+    def _get_nml_and_data_block(self):
+        if self._nml_and_data_block is None:
+            self._nml_and_data_block = self._get_initial_nml_and_data_block()
+
+        return self._nml_and_data_block
+
     def _get_initial_nml_and_data_block(self):
         data_block = self.data_block
+        header_rows = self._data_block_header_rows
 
-        regions = convert_magicc_to_openscm_regions(
-            data_block.columns.get_level_values("region").tolist(), inverse=True
-        )
+        regions = convert_magicc_to_openscm_regions(header_rows["region"], inverse=True)
         regions = self._ensure_file_region_type_consistency(regions)
         variables = convert_magicc7_to_openscm_variables(
-            data_block.columns.get_level_values("variable").tolist(), inverse=True
+            header_rows["variable"], inverse=True
         )
         # trailing EMIS is incompatible, for now
         variables = _strip_emis_variables(variables)
-        units = convert_pint_to_fortran_safe_units(
-            data_block.columns.get_level_values("unit").tolist()
-        )
-        todos = data_block.columns.get_level_values("todo").tolist()
+        units = convert_pint_to_fortran_safe_units(header_rows["unit"])
+        todos = header_rows["todo"]
 
         data_block = data_block.rename(columns=str).reset_index()
-        data_block.columns = [
-            [self._variable_header_row_name] + variables,
-            ["TODO"] + todos,
-            ["UNITS"] + units,
-            ["YEARS"] + regions,
-        ]
+        data_block.columns = pd.MultiIndex.from_arrays(
+            [
+                [self._variable_header_row_name] + variables,
+                ["TODO"] + todos,
+                ["UNITS"] + units,
+                ["YEARS"] + regions,
+            ]
+        )
 
         nml = Namelist()
         nml["THISFILE_SPECIFICATIONS"] = Namelist()
@@ -714,19 +973,18 @@ class _Writer(object):
         )
 
         step_length = data_block.iloc[1:, 0].values - data_block.iloc[:-1, 0].values
-        try:
-            np.testing.assert_allclose(step_length, step_length[0], rtol=0.02)
+        if np.allclose(step_length, step_length[0], rtol=0.02, atol=0):
             step_length = step_length[0]
             annual_steps = np.round(1 / step_length, 1)
             if annual_steps < 1:
                 annual_steps = 0
             else:
                 annual_steps = int(annual_steps)
-        except AssertionError:
+        else:
             annual_steps = 0  # irregular timesteps
         nml["THISFILE_SPECIFICATIONS"]["THISFILE_ANNUALSTEPS"] = annual_steps
 
-        units_unique = list(set(self._get_df_header_row("unit")))
+        units_unique = list(set(header_rows["unit"]))
         nml["THISFILE_SPECIFICATIONS"]["THISFILE_UNITS"] = (
             convert_pint_to_fortran_safe_units(units_unique[0])
             if len(units_unique) == 1
@@ -764,6 +1022,28 @@ class _Writer(object):
         region_col = "region"
         other_names = [n for n in data_block.columns.names if n != region_col]
 
+        # Normally every timeseries (variable, todo, unit) has the same regions, in
+        # which case there's only one region order so we can sort the columns in one
+        # go rather than applying a reordering to every group.
+        columns = data_block.columns
+        regions = columns.get_level_values(region_col).tolist()
+        groups = list(zip(*[columns.get_level_values(n) for n in other_names]))
+        group_regions = {}
+        for group, region in zip(groups, regions):
+            group_regions.setdefault(group, set()).add(region)
+
+        if len(set(map(frozenset, group_regions.values()))) == 1:
+            region_order = self._get_region_order(data_block)
+            group_position = {g: i for i, g in enumerate(group_regions)}
+            region_position = {r: i for i, r in enumerate(region_order)}
+            column_order = sorted(
+                range(len(columns)),
+                key=lambda i: (group_position[groups[i]], region_position[regions[i]]),
+            )
+            data_block = data_block.iloc[:, column_order]
+
+            return self._convert_data_block_to_magicc_time(data_block)
+
         # do transpose to guarantee row ordering (see
         # https://stackoverflow.com/a/40950331), not the case for column ordering
         # annoyingly...
@@ -772,7 +1052,14 @@ class _Writer(object):
         def order_regions(df):
             region_order_df = df.T
             region_order = self._get_region_order(region_order_df)
-            reordered = df.reindex(region_order, level=region_col)
+            # reorder by position rather than reindexing, which rebuilds the index
+            region_position = {r: i for i, r in enumerate(region_order)}
+            group_regions = df.index.get_level_values(region_col).tolist()
+            row_order = sorted(
+                [i for i, r in enumerate(group_regions) if r in region_position],
+                key=lambda i: region_position[group_regions[i]],
+            )
+            reordered = df.iloc[row_order]
             reordered.index = reordered.index.get_level_values(region_col)
 
             return reordered
@@ -796,7 +1083,8 @@ class _Writer(object):
         region_order_magicc = get_region_order(regions, self._scen_7)
 
         region_order = convert_magicc_to_openscm_regions(region_order_magicc)
-        unrecognised_regions = set(regions) - set(region_order)
+        region_order_set = set(region_order)
+        unrecognised_regions = {r for r in regions if r not in region_order_set}
         if unrecognised_regions:
             error_msg = (
                 "Are all of your regions OpenSCM regions? I don't "
@@ -819,14 +1107,20 @@ class _Writer(object):
                 raise ValueError(error_msg)
 
     def _convert_data_block_to_magicc_time(self, data_block):
-        timestamp_months = data_block.index.map(lambda x: x.month)
-        number_months = len(timestamp_months.unique())
+        # MAGICC times run past 2262 so can't be held in a ``pd.DatetimeIndex``,
+        # instead we read the datetime attributes directly, which avoids the overhead
+        # of ``Index.map`` building an intermediate index from each result
+        timestamps = data_block.index.tolist()
+        number_months = len({x.month for x in timestamps})
         if number_months == 1:  # yearly data
-            data_block.index = data_block.index.map(lambda x: x.year)
+            magicc_times = [x.year for x in timestamps]
         else:
-            data_block.index = data_block.index.map(convert_to_decimal_year)
+            # convert_to_decimal_year is cached so repeated times are cheap
+            magicc_times = [convert_to_decimal_year(x) for x in timestamps]
+
+        data_block.index = pd.Index(magicc_times, name=data_block.index.name)
 
         return data_block
 
     def _get_df_header_row(self, col_name):
-        return self.data_block.columns.get_level_values(col_name).tolist()
+        return self._data_block_header_rows[col_name]
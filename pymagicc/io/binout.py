@@ -1,4 +1,5 @@
 import re
+import struct
 
 import numpy as np
 import pandas as pd
@@ -17,7 +18,6 @@ class _BinData(object):
         # read the entire file into memory
         with open(filepath, "rb") as fh:
             self.data = fh.read()
-        self.data = memoryview(self.data)
         self.pos = 0
 
     def read_chunk(self, t):
@@ -28,21 +28,22 @@ class _BinData(object):
         :param t: Data type (same format as used by struct).
         :return: Numpy array if the variable is an array, otherwise a scalar.
         """
-        size = self.data[self.pos : self.pos + 4].cast("i")[0]
-        d = self.data[self.pos + 4 : self.pos + 4 + size]
-
-        actual_size = self.data[self.pos + 4 + size : self.pos + 4 + size + 4].cast(
-            "i"
-        )[0]
+        (size,) = struct.unpack_from("=i", self.data, self.pos)
+        (actual_size,) = struct.unpack_from("=i", self.data, self.pos + 4 + size)
 
         if not actual_size == size:
             raise AssertionError(
                 "Expected data size: {}, got: {}".format(size, actual_size)
             )
 
-        self.pos = self.pos + 4 + size + 4
+        # numpy understands the struct type codes, so the chunk can be viewed in
+        # place rather than copied out
+        dtype = np.dtype(t)
+        res = np.frombuffer(
+            self.data, dtype=dtype, count=size // dtype.itemsize, offset=self.pos + 4
+        )
 
-        res = np.array(d.cast(t))
+        self.pos = self.pos + 4 + size + 4
 
         # Return as a scalar or a numpy array if it is an array
         if res.size == 1:
@@ -102,7 +103,8 @@ class _LegacyBinFormat:
         if metadata["datacolumns"] == 1:
             num_boxes = 0
 
-            data = globe[:, np.newaxis]
+            # copy as the chunks are read-only views of the file's bytes
+            data = globe[:, np.newaxis].copy()
 
             regions = ["World"]
 
@@ -123,8 +125,8 @@ class _LegacyBinFormat:
 
         df = pd.DataFrame(data, index=index)
 
-        if isinstance(df.index, pd.core.indexes.numeric.Float64Index):
-            df.index = df.index.to_series().round(3)
+        if df.index.dtype.kind == "f":
+            df.index = pd.Index(np.round(df.index.values, 3), name=df.index.name)
 
         df.index.name = "time"
 
@@ -175,8 +177,8 @@ class _V2BinFormat(_LegacyBinFormat):
 
         df = pd.DataFrame(np.asarray(data).T, index=index)
 
-        if isinstance(df.index, pd.core.indexes.numeric.Float64Index):
-            df.index = df.index.to_series().round(3)
+        if df.index.dtype.kind == "f":
+            df.index = pd.Index(np.round(df.index.values, 3), name=df.index.name)
 
         df.index.name = "time"
 
@@ -203,7 +205,7 @@ def get_bin_format(version):
 
 
 class _BinaryOutReader(_Reader):
-    _regexp_capture_variable = re.compile(r"DAT\_(.*)\.BINOUT$")
+    _regexp_capture_variable = re.compile(r"DAT\_(.*)\.BINOUT$", re.ASCII)
     _default_todo_fill_value = "not_relevant"
 
     def _determine_bin_version(self, data):
@@ -1,3 +1,6 @@
+import struct
+
+import numpy as np
 import pandas as pd
 
 from pymagicc.definitions import (
@@ -6,6 +9,7 @@ from pymagicc.definitions import (
 )
 
 from .base import _Reader
+from .binout import _BinData
 
 
 def find_parameter_groups(columns):
@@ -61,127 +65,131 @@ class _CompactOutReader(_Reader):
         with open(self.filepath, "r") as fh:
             headers = self._read_header(fh)
             # TODO: change to reading a limited number of lines
-            lines_as_dicts = [line for line in self._read_lines(fh, headers)]
+            # every line ends with a trailing comma, which leaves an empty field
+            # after the last column, so only the named columns are read
+            compact_table = pd.read_csv(
+                fh,
+                names=headers,
+                header=None,
+                usecols=range(len(headers)),
+                dtype=np.float64,
+                engine="c",
+                na_filter=False,
+            )
 
-        return pd.DataFrame(lines_as_dicts)
+        return compact_table
 
     def _read_header(self, fh):
         line = fh.readline().strip(",\n")
         return [item.strip('"') for item in line.split(",")]
 
-    def _read_lines(self, fh, headers):
-        for line in fh:
-            toks = line.strip(",\n").split(",")
-
-            if not len(toks) == len(headers):
-                raise AssertionError("# headers does not match # lines")
-
-            yield {h: float(v) for h, v in zip(headers, toks)}
-
     def _convert_compact_table_to_df_metadata_column_headers(self, compact_table):
         ts_cols = [c for c in compact_table if "__" in c]
         para_cols = [c for c in compact_table if "__" not in c]
 
-        ts = compact_table[ts_cols]
-        ts = ts.T
-
-        def sort_ts_ids(inid):
-            variable, region, year = inid.split("__")
-            variable = variable.replace("DAT_", "")
-
-            return {"variable": variable, "region": region, "year": year}
-
-        ts["variable"] = ts.index.map(
-            lambda x: convert_magicc7_to_openscm_variables(
-                x.split("__")[0].replace("DAT_", "")
-            )
-        )
-        ts["region"] = ts.index.map(
-            lambda x: convert_magicc_to_openscm_regions(x.split("__")[1])
-        )
+        # split each id once and only convert the unique variables and regions
+        ts_ids = [c.split("__") for c in ts_cols]
+        magicc_variables = [i[0].replace("DAT_", "") for i in ts_ids]
+        magicc_regions = [i[1] for i in ts_ids]
+        variable_map = {
+            v: convert_magicc7_to_openscm_variables(v) for v in set(magicc_variables)
+        }
+        region_map = {
+            r: convert_magicc_to_openscm_regions(r) for r in set(magicc_regions)
+        }
 
-        ts["year"] = ts.index.map(lambda x: x.split("__")[2])
+        years = [i[2] for i in ts_ids]
         # Make sure all the year strings are four characters long. Not the best test,
         # but as good as we can do for now.
-        if not (ts["year"].apply(len) == 4).all():  # pragma: no cover # safety valve
+        if not all([len(y) == 4 for y in years]):  # pragma: no cover # safety valve
             raise NotImplementedError("Non-annual data not yet supported")
 
-        ts["year"] = ts["year"].astype(int)
-
-        ts = ts.reset_index(drop=True)
-
-        id_cols = {"variable", "region", "year"}
-        run_cols = set(ts.columns) - id_cols
-        ts = ts.melt(value_vars=run_cols, var_name="run_id", id_vars=id_cols)
-
-        ts["unit"] = "unknown"
-
-        new_index = list(set(ts.columns) - {"value"})
-        ts = ts.set_index(new_index)["value"].unstack("year")
+        years = [int(y) for y in years]
+
+        # The table is one row per run with a column for every (variable, region,
+        # year) so we can scatter the values straight into a (year, run, (variable,
+        # region)) array rather than reshaping with pandas, which copies the data
+        # several times.
+        timeseries = {}
+        timeseries_codes = [
+            timeseries.setdefault((variable_map[v], region_map[r]), len(timeseries))
+            for v, r in zip(magicc_variables, magicc_regions)
+        ]
+        time_index = sorted(set(years))
+        year_codes = {y: i for i, y in enumerate(time_index)}
+
+        run_ids = compact_table.index.tolist()
+        data = np.full((len(time_index), len(run_ids), len(timeseries)), np.nan)
+        year_codes = [year_codes[y] for y in years]
+        data[year_codes, :, timeseries_codes] = compact_table[ts_cols].values.T
 
         paras = compact_table[para_cols]
-        paras.index.name = "run_id"
+        cols_to_merge = find_parameter_groups(para_cols)
+        merged_cols = {c for components in cols_to_merge.values() for c in components}
 
-        cols_to_merge = find_parameter_groups(paras.columns.tolist())
-
-        paras_clean = paras.copy()
+        para_values = {c: paras[c].tolist() for c in para_cols if c not in merged_cols}
         # Aggregate the columns
         for new_col, components in cols_to_merge.items():
-            components = sorted(components)
-            paras_clean.loc[:, new_col] = tuple(paras[components].values.tolist())
-            paras_clean = paras_clean.drop(columns=components)
-
-        years = ts.columns.tolist()
-        ts = ts.reset_index().set_index("run_id")
-        out = pd.merge(ts, paras_clean, left_index=True, right_index=True).reset_index()
-
-        id_cols = set(out.columns) - set(years)
-        out = out.melt(value_vars=years, var_name="year", id_vars=id_cols)
-        new_index = list(set(out.columns) - {"value"})
-        out = out.set_index(new_index)["value"].unstack("year")
-        out = out.T
+            para_values[new_col] = [tuple(v) for v in paras[components].values.tolist()]
 
+        # columns are ordered run by run, with every timeseries for each run
+        n_timeseries = len(timeseries)
         column_headers = {
-            name.lower(): out.columns.get_level_values(name).tolist()
-            for name in out.columns.names
+            "variable": [v for v, _ in timeseries] * len(run_ids),
+            "region": [r for _, r in timeseries] * len(run_ids),
+            "unit": ["unknown"] * (n_timeseries * len(run_ids)),
+            "run_id": [r for r in run_ids for _ in range(n_timeseries)],
         }
-        df = out.copy()
+        for name, values in para_values.items():
+            column_headers[name.lower()] = [
+                v for v in values for _ in range(n_timeseries)
+            ]
+
+        out = pd.DataFrame(
+            data.reshape(len(time_index), -1), index=pd.Index(time_index, name="year")
+        )
         metadata = {}
 
-        return metadata, df, column_headers
+        return metadata, out, column_headers
 
 
 class _BinaryCompactOutReader(_CompactOutReader):
     def _read_compact_table(self):
-        with open(self.filepath, "rb") as fh:
-            headers = self._read_header(fh)
-            # can change to reading limited number of lines in future
-            lines_as_dicts = [line for line in self._read_lines(fh, headers)]
+        # read the entire file into memory and walk through it, rather than making
+        # three small reads from the file for every item
+        bin_data = _BinData(self.filepath)
+        headers = self._read_header(bin_data)
+        # can change to reading limited number of lines in future
+        raw_lines = b"".join(self._read_lines(bin_data, headers))
 
-        return pd.DataFrame(lines_as_dicts)
+        # single float32 -> float64 conversion of the whole table, rather than one
+        # Python float per value
+        data = np.frombuffer(raw_lines, dtype=np.float32).reshape(-1, len(headers))
 
-    def _read_header(self, fh):
-        first_value = self._read_item(fh).tobytes()
+        return pd.DataFrame(data.astype(np.float64), columns=headers)
+
+    def _read_header(self, bin_data):
+        first_value = self._read_item(bin_data).tobytes()
         if not first_value == b"COMPACT_V1":
             raise AssertionError("Unexpected first value: {}".format(first_value))
 
-        second_value = self._read_item(fh).tobytes()
+        second_value = self._read_item(bin_data).tobytes()
         if not second_value == b"HEAD":
             raise AssertionError("Unexpected second value: {}".format(second_value))
 
         items = []
         while True:
-            item = self._read_item(fh)
+            item = self._read_item(bin_data)
             if item is None or item.tobytes() == b"END":
                 break
             items.append(item.tobytes().decode())
 
         return items
 
-    def _read_lines(self, fh, headers):
+    def _read_lines(self, bin_data, headers):
         while True:
 
-            items = self._read_item(fh)
+            items = self._read_item(bin_data)
             if items is None:
                 break
 
@@ -191,25 +199,27 @@ class _BinaryCompactOutReader(_CompactOutReader):
                 raise AssertionError("# headers does not match # lines")
 
             # Check the line terminator
-            item = self._read_item(fh)
+            item = self._read_item(bin_data)
             if not item.tobytes() == b"END":
                 raise AssertionError(
                     "Unexpected final line value: {}".format(item.tobytes())
                 )
 
-            yield {h: float(v) for h, v in zip(headers, items.tolist())}
+            yield items
 
-    def _read_item(self, fh):
+    def _read_item(self, bin_data):
         # Fortran writes out a 4 byte integer representing the # of bytes to read for
         # a given chunk, the data and then the size again
-        d = fh.read(4)
-        if d != b"":
-            s = memoryview(d).cast("i")[0]
-            item = memoryview(fh.read(s))
-            s_after = memoryview(fh.read(4)).cast("i")[0]
+        if bin_data.pos < len(bin_data.data):
+            (s,) = struct.unpack_from("=i", bin_data.data, bin_data.pos)
+            start = bin_data.pos + 4
+            item = memoryview(bin_data.data)[start : start + s]
+            (s_after,) = struct.unpack_from("=i", bin_data.data, start + s)
             if not s_after == s:
                 raise AssertionError(
                     "Wrong size after data. Before: {}. " "After: {}".format(s, s_after)
                 )
 
+            bin_data.pos = start + s + 4
+
             return item
@@ -1,16 +1,13 @@
 import re
 
-from pymagicc.definitions import (
-    convert_magicc6_to_magicc7_variables,
-    convert_magicc7_to_openscm_variables,
-)
+from pymagicc.definitions import convert_magicc6_to_magicc7_variables
 
 from .base import _EmisInReader, _FourBoxReader, _Writer
 from .utils import _strip_emis_variables
 
 
 class _ConcInReader(_FourBoxReader):
-    _regexp_capture_variable = re.compile(r".*\_(\w*\-?\w*\_CONC)\.IN$")
+    _regexp_capture_variable = re.compile(r".*\_(\w*\-?\w*\_CONC)\.IN$", re.ASCII)
 
     def _get_variable_from_filepath(self):
         variable = super()._get_variable_from_filepath()
@@ -22,7 +19,7 @@ class _ConcInReader(_FourBoxReader):
 
 
 class _OpticalThicknessInReader(_FourBoxReader):
-    _regexp_capture_variable = re.compile(r".*\_(\w*\_OT)\.IN$")
+    _regexp_capture_variable = re.compile(r".*\_(\w*\_OT)\.IN$", re.ASCII)
 
     def _read_magicc6_style_header(self, stream, metadata):
         column_headers, metadata = super()._read_magicc6_style_header(stream, metadata)
@@ -38,7 +35,7 @@ class _OpticalThicknessInReader(_FourBoxReader):
 
 
 class _RadiativeForcingInReader(_FourBoxReader):
-    _regexp_capture_variable = re.compile(r".*\_(\w*\_RF)\.(IN|MON)$")
+    _regexp_capture_variable = re.compile(r".*\_(\w*\_RF)\.(IN|MON)$", re.ASCII)
 
     def _read_data_header_line(self, stream, expected_header):
         tokens = super()._read_data_header_line(stream, expected_header)
@@ -54,32 +51,30 @@ class _RadiativeForcingInReader(_FourBoxReader):
 
 
 class _SurfaceTemperatureInReader(_FourBoxReader):
-    _regexp_capture_variable = re.compile(r".*\_(SURFACE_TEMP)\.IN$")
+    _regexp_capture_variable = re.compile(r".*\_(SURFACE_TEMP)\.IN$", re.ASCII)
 
 
 class _StandardEmisInReader(_EmisInReader):
-    _regexp_capture_variable = re.compile(r".*\_(\w*\_EMIS)\.IN$")
+    _regexp_capture_variable = re.compile(r".*\_(\w*\_EMIS)\.IN$", re.ASCII)
     _variable_line_keyword = "GAS"
 
     def _read_data_header_line(self, stream, expected_header):
         tokens = super()._read_data_header_line(stream, expected_header)
         return [t.replace("EMIS-", "") for t in tokens]
 
+    def _normalise_variables(self, variables):
+        # TODO: work out a way to avoid this fragile check
+        return [
+            v
+            if v.upper().endswith("_EMIS") or v.startswith("Emissions")
+            else v + "_EMIS"
+            for v in variables
+        ]
+
     def _get_column_headers_and_update_metadata(self, stream, metadata):
         column_headers, metadata = super()._get_column_headers_and_update_metadata(
             stream, metadata
         )
-
-        tmp_vars = []
-        for v in column_headers["variable"]:
-            # TODO: work out a way to avoid this fragile check and calling the
-            # conversion once in the superclass method and again below
-            if v.endswith("_EMIS") or v.startswith("Emissions"):
-                tmp_vars.append(v)
-            else:
-                tmp_vars.append(v + "_EMIS")
-
-        column_headers["variable"] = convert_magicc7_to_openscm_variables(tmp_vars)
         column_headers = self._read_units(column_headers)
 
         return column_headers, metadata
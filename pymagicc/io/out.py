@@ -10,7 +10,7 @@ from .in_files import _EmisInReader
 
 
 class _OutReader(_FourBoxReader):
-    _regexp_capture_variable = re.compile(r"DAT\_(\w*)\.OUT$")
+    _regexp_capture_variable = re.compile(r"DAT\_(\w*)\.OUT$", re.ASCII)
     _default_todo_fill_value = "not_relevant"
 
     def _get_column_headers_and_update_metadata(self, stream, metadata):
@@ -27,7 +27,7 @@ class _EmisOutReader(_EmisInReader, _OutReader):
 
 
 class _InverseEmisReader(_EmisOutReader):
-    _regexp_capture_variable = re.compile(r"(INVERSEEMIS)\.OUT$")
+    _regexp_capture_variable = re.compile(r"(INVERSEEMIS)\.OUT$", re.ASCII)
 
     def _get_column_headers_and_update_metadata(self, stream, metadata):
         units = self._read_data_header_line(stream, "UNITS:")
@@ -51,16 +51,15 @@ class _InverseEmisReader(_EmisOutReader):
                 pass
 
         # get rid of confusing units before passing to read_units
-        column_headers["unit"] = [
-            v.replace("kt/yr", "kt") for v in column_headers["unit"]
-        ]
+        clean_units = {v: v.replace("kt/yr", "kt") for v in set(column_headers["unit"])}
+        column_headers["unit"] = [clean_units[v] for v in column_headers["unit"]]
         column_headers = super()._read_units(column_headers)
 
         return column_headers, metadata
 
 
 class _TempOceanLayersOutReader(_Reader):
-    _regexp_capture_variable = re.compile(r"(TEMP\_OCEANLAYERS\_?\w*)\.OUT$")
+    _regexp_capture_variable = re.compile(r"(TEMP\_OCEANLAYERS\_?\w*)\.OUT$", re.ASCII)
     _default_todo_fill_value = "not_relevant"
 
     def _read_magicc6_style_header(self, stream, metadata):
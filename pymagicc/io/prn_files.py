@@ -13,6 +13,11 @@ from ..definitions import (
 from .base import _Writer
 from .scen import _NonStandardEmisInReader
 
+_PRN_NON_DATA_LINE_REGEXP = re.compile(r"^(?!\d{4}\s)", flags=re.MULTILINE | re.ASCII)
+"""
+:obj:`re.Pattern`: Matches the start of any line which isn't a data line in a PRN file
+"""
+
 
 class _PrnReader(_NonStandardEmisInReader):
     def read(self):
@@ -72,30 +77,29 @@ class _PrnReader(_NonStandardEmisInReader):
     def _read_header(self):
         # ignore first line, not useful for read
         self._stream.readline()
-        # I don't know how to do this without these nasty while True statements
         header_notes_lines = []
         end_of_notes_keys = ("CFC11", "CFC-11", "Years")
-        while True:
-            prev_pos = self._stream.tell()
-            line = self._stream.readline()
-            if not line:
-                raise ValueError(
-                    "Reached end of file without finding {} which should "
-                    "always be the start of the data header line in a .prn file".format(
-                        end_of_notes_keys
-                    )
-                )
-
-            if line.startswith((end_of_notes_keys)):
-                self._stream.seek(prev_pos)
+        # the stream is a ``StringIO`` so positions are character offsets and we can
+        # keep track of the start of each line ourselves rather than asking for it
+        line_start = self._stream.tell()
+        for line in self._stream:
+            if line.startswith(end_of_notes_keys):
+                self._stream.seek(line_start)
                 break
 
             header_notes_lines.append(line)
+            line_start += len(line)
+        else:
+            raise ValueError(
+                "Reached end of file without finding {} which should "
+                "always be the start of the data header line in a .prn file".format(
+                    end_of_notes_keys
+                )
+            )
 
         return header_notes_lines
 
     def read_data_block(self):
-        data_block_stream = StringIO()
         # read in data block header, removing "Years" because it's just confusing
         # and can't be used for validation as it only appears in some files.
         data_block_header_line = self._stream.readline().replace("Years", "").strip()
@@ -106,25 +110,27 @@ class _PrnReader(_NonStandardEmisInReader):
             variable = data_block_header_line[w : w + col_width].strip()
             variables.append(variable)
 
+        yr_col_width = 4
+        col_widths = [yr_col_width] + [col_width] * len(variables)
+
         # update in read method using metadata
         todos = ["unknown"] * len(variables)
         units = ["unknown"] * len(variables)
         regions = ["unknown"] * len(variables)
 
-        while True:
-            prev_pos = self._stream.tell()
-            line = self._stream.readline()
-            if not line:
-                # reached end of file
-                break
-            if not re.match(r"^\d{4}\s", line):
-                break
-            data_block_stream.write(line)
+        # the data block runs until the first line which doesn't start with a four
+        # digit year followed by whitespace (or the end of the file)
+        data_block_start = self._stream.tell()
+        remaining = self._stream.read()
+        non_data_line = _PRN_NON_DATA_LINE_REGEXP.search(remaining)
+        if non_data_line is None:
+            data_block_end = len(remaining)
+        else:
+            data_block_end = non_data_line.start()
 
-        yr_col_width = 4
-        col_widths = [yr_col_width] + [10] * len(variables)
-        data_block_stream.seek(0)
-        df = pd.read_fwf(data_block_stream, widths=col_widths, header=None, index_col=0)
+        df = self._convert_fixed_width_data_block_to_df(
+            remaining[:data_block_end], col_widths
+        )
         df.index.name = "time"
         columns = {
             "variable": variables,
@@ -134,19 +140,39 @@ class _PrnReader(_NonStandardEmisInReader):
         }
 
         # put stream back for notes reading
-        self._stream.seek(prev_pos)
+        self._stream.seek(data_block_start + data_block_end)
 
         return df, columns
 
-    def _read_notes(self):
-        notes = []
-        while True:
-            line = self._stream.readline()
-            if not line:
-                break
-            notes.append(line)
+    @staticmethod
+    def _convert_fixed_width_data_block_to_df(data_block, col_widths):
+        # Every data line has a four digit year followed by fixed width numeric
+        # columns so we can slice out the fields and convert them all at once,
+        # which is much quicker than pandas' fixed width parser. Anything else
+        # (e.g. short lines with missing fields) goes through pandas.
+        col_ends = np.cumsum(col_widths).tolist()
+        col_bounds = list(zip([0] + col_ends[:-1], col_ends))
+        try:
+            data = np.array(
+                [
+                    [line[start:end] for start, end in col_bounds]
+                    for line in data_block.splitlines()
+                ],
+                dtype=float,
+            )
+            if data.ndim != 2:
+                raise ValueError("Empty data block")
+
+        except ValueError:
+            return pd.read_fwf(
+                StringIO(data_block), widths=col_widths, header=None, index_col=0
+            )
 
-        return notes
+        return pd.DataFrame(data[:, 1:], index=data[:, 0].astype(np.int64))
+
+    def _read_notes(self):
+        # everything left in the stream is notes
+        return self._stream.readlines()
 
 
 class _PrnWriter(_Writer):
@@ -156,28 +182,29 @@ class _PrnWriter(_Writer):
         if unit == "t":
             unit = "metric tons"
         self.minput.metadata["unit"] = unit
-        output.write(self._get_header())
+        # the header has to go after the indicator line, which can only be
+        # derived once we know the data block, so it is written with the data block
+        self._header = self._get_header()
         return output
 
     def _write_namelist(self, output):
         return output
 
     def _write_datablock(self, output):
-        lines = output.getvalue().split(self._newline_char)
-
         unit = self._get_unit()
         if unit == "t":
-            other_col_format_str = "{:9.0f}".format
+            other_col_format = "9.0f"
         elif unit == "ppt":
-            other_col_format_str = "{:9.3e}".format
+            other_col_format = "9.3e"
 
-        data_block = self._get_data_block()
+        # already derived (and checked) in ``write``
+        data_block = self.data_block
 
         # line with number of rows to skip, start year and end year
         number_indicator_lines = 1
         number_blank_lines_after_indicator = 1
 
-        number_header_lines = len(lines)
+        number_header_lines = self._header.count(self._newline_char) + 1
         number_blank_lines_after_header = 1
 
         data_block_header_rows = 1
@@ -193,22 +220,18 @@ class _PrnWriter(_Writer):
             + number_blank_lines_after_data_block_header_rows
         )
 
-        firstyear = int(np.floor(data_block.iloc[0, 0]))
-        lastyear = int(np.floor(data_block.iloc[-1, 0]))
+        # the index still holds the years (they are also the first column)
+        firstyear = int(np.floor(data_block.index[0]))
+        lastyear = int(np.floor(data_block.index[-1]))
         indicator_line = "{:10d}{:10d}{:10d}".format(
             line_above_data_block, firstyear, lastyear
         )
-        lines.insert(0, indicator_line)
-        lines.insert(1, "")
-        lines.append("")
+        lines = [indicator_line, "", self._header, ""]
 
         # format is irrelevant for the source
         # however it does matter for reading in again with pymagicc
         time_col_length = 10
-        first_col_format_str = ("{" + ":{}d".format(time_col_length) + "}").format
-
-        formatters = [other_col_format_str] * len(data_block.columns)
-        formatters[0] = first_col_format_str
+        first_col_format = "{}d".format(time_col_length)
 
         col_headers = data_block.columns.tolist()
         col_header = (
@@ -218,16 +241,14 @@ class _PrnWriter(_Writer):
         lines.append(col_header)
         lines.append("")  # add blank line between data block header and data block
 
-        data_block_str = data_block.to_string(
-            index=False, header=False, formatters=formatters, sparsify=False
+        col_formats = [first_col_format] + [other_col_format] * (
+            len(data_block.columns) - 1
         )
+        data_block_str = self._format_data_block(data_block, col_formats, header=False)
 
         lines.append(data_block_str)
         lines.append("")  # new line at end of file
-        output.seek(0)
-        output.write(self._newline_char.join(lines))
-
-        return output
+        return self._write_lines(output, lines)
 
     def _get_unit(self):
         units = self.minput["unit"].unique().tolist()
@@ -281,8 +302,9 @@ class _PrnWriter(_Writer):
 
         data_block = data_block[PART_OF_PRNFILE]
 
-        data_block.index.name = "Years"
         data_block = self._convert_data_block_to_magicc_time(data_block)
-        data_block.reset_index(inplace=True)
+        # the years become the first column, the index itself is never written so
+        # there is no need to name and reset it
+        data_block.insert(0, "Years", data_block.index)
 
         return data_block
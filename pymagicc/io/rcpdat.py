@@ -1,8 +1,7 @@
 import warnings
+from copy import deepcopy
 from datetime import datetime
 
-from six import StringIO
-
 from pymagicc.definitions import (
     convert_magicc6_to_magicc7_variables,
     convert_magicc7_to_openscm_variables,
@@ -11,22 +10,33 @@ from pymagicc.definitions import (
 
 from .base import _EmisInReader, _Reader, _Writer
 
+_RCP_FIRST_VARIABLE_SUFFIXES = {
+    "CO2I": ("_EMIS", False),
+    "CO2EQ": ("_CONC", False),
+    "TOTAL_INCLVOLCANIC_RF": ("_RF", True),
+    "TOTAL_INCLVOLCANIC_ERF": ("_ERF", True),
+}
+"""
+dict: Variable suffix to add, and whether to add it only where it is missing, keyed by
+the first variable in an RCP .DAT file
+"""
+
+_EMIS_UNITS_CONVERTER = _EmisInReader("junk")
+"""
+:obj:`_EmisInReader`: Reader used only for its emissions unit conversion, it holds no
+state which depends on the file so one instance is shared by every read
+"""
+
 
 class _RCPDatReader(_Reader):
     def read(self):
         nml_start, nml_end = self._set_lines_and_find_nml()
 
         # ignore all nml_values as they are redundant
-        header = "".join(self.lines[:nml_start])
-        metadata = self.process_header(header)
+        metadata = self._process_header_lines(self.lines[:nml_start])
 
         # Create a stream from the remaining lines, ignoring any blank lines
-        stream = StringIO()
-        cleaned_lines = [
-            line.strip() for line in self.lines[nml_end + 1 :] if line.strip()
-        ]
-        stream.write("\n".join(cleaned_lines))
-        stream.seek(0)
+        stream = self._get_stream_without_blank_lines(self.lines[nml_end + 1 :])
 
         df, metadata, columns = self.process_data(stream, metadata)
 
@@ -41,6 +51,22 @@ class _RCPDatReader(_Reader):
         header : str
             All the lines in the header.
 
+        Returns
+        -------
+        dict
+            The metadata in the header.
+        """
+        return self._process_header_lines(header.split("\n"))
+
+    def _process_header_lines(self, lines):
+        """
+        Parse the header for additional metadata.
+
+        Parameters
+        ----------
+        lines : list of str
+            The lines in the header, with or without trailing newlines.
+
         Returns
         -------
         dict
@@ -48,14 +74,16 @@ class _RCPDatReader(_Reader):
         """
         metadata = {}
 
-        lines_iterator = (line.strip() for line in header.split("\n"))
-        for i in range(len(header.split("\n"))):
-            line = next(lines_iterator)
+        lines = [line.strip() for line in lines]
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            i += 1
 
             if not line:
                 continue
 
-            if line.strip().startswith("COLUMN_DESCRIPTION"):
+            if line.startswith("COLUMN_DESCRIPTION"):
                 break
             if ":" not in line:
                 continue
@@ -68,11 +96,11 @@ class _RCPDatReader(_Reader):
 
             content = ":".join(split_vals[1:])
             if key == "NOTE":
+                # notes run until the next blank line
                 content = [content]
-                line = next(lines_iterator)
-                while line:
-                    content.append(line)
-                    line = next(lines_iterator)
+                while i < len(lines) and lines[i]:
+                    content.append(lines[i])
+                    i += 1
 
             metadata[key.lower()] = content
 
@@ -103,14 +131,15 @@ class _RCPDatReader(_Reader):
         column_headers = self._read_units(column_headers)
         if column_headers["variable"][0].startswith("Emissions"):
             # massive hack, refactor in cleanup
-            converter = _EmisInReader("junk")
-            # clean up ambiguous units so converter can do its thing
-            column_headers["unit"] = [
-                u.replace("kt/yr", "kt").replace("Mt/yr", "Mt")
-                for u in column_headers["unit"]
-            ]
+            # clean up ambiguous units so converter can do its thing (there are only
+            # a handful of distinct units so each is only cleaned once)
+            clean_units = {
+                u: u.replace("kt/yr", "kt").replace("Mt/yr", "Mt")
+                for u in set(column_headers["unit"])
+            }
+            column_headers["unit"] = [clean_units[u] for u in column_headers["unit"]]
 
-            column_headers = converter._read_units(column_headers)
+            column_headers = _EMIS_UNITS_CONVERTER._read_units(column_headers)
 
         column_headers["scenario"] = [metadata.pop("run")]
         column_headers["climate_model"] = [
@@ -126,28 +155,18 @@ class _RCPDatReader(_Reader):
         # work out whether we have emissions, concentrations or radiative
         # forcing, I think this is the best way to do it given the stability
         # of the format
-        first_var = magicc7_vars[0]
-        if first_var == "CO2I":
-            intermediate_vars = [m + "_EMIS" for m in magicc7_vars]
-        elif first_var == "CO2EQ":
-            intermediate_vars = [m + "_CONC" for m in magicc7_vars]
-        elif first_var == "TOTAL_INCLVOLCANIC_RF":
-            intermediate_vars = []
-            for m in magicc7_vars:
-                if not m.endswith("_RF"):
-                    m = m + "_RF"
-                intermediate_vars.append(m)
-        elif first_var == "TOTAL_INCLVOLCANIC_ERF":
-            intermediate_vars = []
-            for m in magicc7_vars:
-                if not m.endswith("_ERF"):
-                    m = m + "_ERF"
-                intermediate_vars.append(m)
-        else:
+        try:
+            suffix, only_if_missing = _RCP_FIRST_VARIABLE_SUFFIXES[magicc7_vars[0]]
+        except KeyError:
             raise ValueError(
                 "I don't know how you got this file, but the format is not recognised by pymagicc"
             )
 
+        intermediate_vars = [
+            m if only_if_missing and m.endswith(suffix) else m + suffix
+            for m in magicc7_vars
+        ]
+
         res = convert_magicc7_to_openscm_variables(intermediate_vars)
 
         return res
@@ -485,8 +504,8 @@ class _RCPDatWriter(_Writer):
         return header
 
     def _write_namelist(self, output):
-        nml_initial, _ = self._get_initial_nml_and_data_block()
-        nml = nml_initial.copy()
+        nml_initial, _ = self._get_nml_and_data_block()
+        nml = deepcopy(nml_initial)
 
         # '&NML_INDICATOR' goes above, '/'' goes at end
         number_lines_nml_header_end = 2
@@ -498,7 +517,8 @@ class _RCPDatWriter(_Writer):
         nml["THISFILE_SPECIFICATIONS"].pop("THISFILE_REGIONMODE")
 
         nml["THISFILE_SPECIFICATIONS"]["THISFILE_FIRSTDATAROW"] = (
-            len(output.getvalue().split(self._newline_char))
+            output.getvalue().count(self._newline_char)
+            + 1
             + len(nml["THISFILE_SPECIFICATIONS"])
             + number_lines_nml_header_end
             + len(line_after_nml.split(self._newline_char))
@@ -532,18 +552,17 @@ class _RCPDatWriter(_Writer):
         return output
 
     def _write_datablock(self, output):
-        _, data_block = self._get_initial_nml_and_data_block()
+        _, data_block = self._get_nml_and_data_block()
 
-        drop_levels = []
-        for i in range(len(data_block.columns.levels)):
-            if data_block.columns.get_level_values(i)[0] not in ["VARIABLE", "UNITS"]:
-                drop_levels.append(i)
+        # the first column holds the label of each level so we only need to look
+        # at it, rather than the full values of every level
+        keep_labels = ["VARIABLE", "UNITS"]
+        level_labels = data_block.columns[0]
+        drop_levels = [i for i, v in enumerate(level_labels) if v not in keep_labels]
 
         data_block.columns = data_block.columns.droplevel(drop_levels)
 
-        for i in range(len(data_block.columns.levels)):
-            if data_block.columns.get_level_values(i)[0] == "UNITS":
-                units_level = i
+        units_level = {v: i for i, v in enumerate(data_block.columns[0])}["UNITS"]
 
         if self._filepath.endswith("_RADFORCING.DAT"):
             return self._write_variable_datablock_radforcing(
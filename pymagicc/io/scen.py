@@ -1,5 +1,8 @@
+import bisect
+import re
 import warnings
 
+import numpy as np
 import pandas as pd
 from six import StringIO
 
@@ -15,11 +18,25 @@ from pymagicc.definitions import (
 from .base import _EmisInReader, _Writer
 from .utils import _strip_emis_variables, get_region_order
 
+_SCENFILE_EMISSIONS_CODES = {
+    frozenset(PART_OF_SCENFILE_WITH_EMISSIONS_CODE_0): 0,
+    frozenset(PART_OF_SCENFILE_WITH_EMISSIONS_CODE_1): 1,
+}
+"""dict: Map from the set of emissions in a SCEN file to its emissions code"""
+
+_SCENFILE_REGION_CODES = {
+    frozenset(["WORLD"]): 1,
+    frozenset(["WORLD", "OECD90", "REF", "ASIA", "ALM"]): 2,
+    frozenset(["WORLD", "R5OECD", "R5REF", "R5ASIA", "R5MAF", "R5LAM"]): 3,
+    frozenset(["WORLD", "R5OECD", "R5REF", "R5ASIA", "R5MAF", "R5LAM", "BUNKERS"]): 4,
+}
+"""dict: Map from the set of regions in a SCEN file to its region code"""
+
 
 class _NonStandardEmisInReader(_EmisInReader):
     def _set_lines(self):
         with self._open_file() as f:
-            self.lines = f.readlines()
+            self.lines = self._read_file(f)
 
     def read(self):
         self._set_lines()
@@ -35,12 +52,7 @@ class _NonStandardEmisInReader(_EmisInReader):
 
     def _get_stream(self):
         # Create a stream to work with, ignoring any blank lines
-        stream = StringIO()
-        cleaned_lines = [line.strip() for line in self.lines if line.strip()]
-        stream.write("\n".join(cleaned_lines))
-        stream.seek(0)
-
-        return stream
+        return self._get_stream_without_blank_lines(self.lines)
 
     def _read_header(self):
         raise NotImplementedError()
@@ -87,30 +99,20 @@ def get_special_scen_code(regions, emissions):
     int
         The special scen code for the regions-emissions combination provided.
     """
-    if sorted(set(PART_OF_SCENFILE_WITH_EMISSIONS_CODE_0)) == sorted(set(emissions)):
-        scenfile_emissions_code = 0
-    elif sorted(set(PART_OF_SCENFILE_WITH_EMISSIONS_CODE_1)) == sorted(set(emissions)):
-        scenfile_emissions_code = 1
-    else:
+    try:
+        scenfile_emissions_code = _SCENFILE_EMISSIONS_CODES[frozenset(emissions)]
+    except KeyError:
         msg = "Could not determine scen special code for emissions {}".format(emissions)
         raise ValueError(msg)
 
-    if set(regions) == set(["WORLD"]):
-        scenfile_region_code = 1
-    elif set(regions) == set(["WORLD", "OECD90", "REF", "ASIA", "ALM"]):
-        scenfile_region_code = 2
-    elif set(regions) == set(["WORLD", "R5OECD", "R5REF", "R5ASIA", "R5MAF", "R5LAM"]):
-        scenfile_region_code = 3
-    elif set(regions) == set(
-        ["WORLD", "R5OECD", "R5REF", "R5ASIA", "R5MAF", "R5LAM", "BUNKERS"]
-    ):
-        scenfile_region_code = 4
     try:
-        return scenfile_region_code * 10 + scenfile_emissions_code
-    except NameError:
+        scenfile_region_code = _SCENFILE_REGION_CODES[frozenset(regions)]
+    except KeyError:
         msg = "Could not determine scen special code for regions {}".format(regions)
         raise ValueError(msg)
 
+    return scenfile_region_code * 10 + scenfile_emissions_code
+
 
 class _ScenReader(_NonStandardEmisInReader):
     def read(self):
@@ -175,6 +177,14 @@ class _ScenReader(_NonStandardEmisInReader):
     def read_data_block(self):
         number_years = int(self.lines[0].strip())
 
+        # offsets of the end of each line in the stream, so we can slice out each
+        # region's data directly rather than reading it line by line
+        stream_text = self._stream.getvalue()
+        line_ends = [m.end() for m in re.finditer("\n", stream_text)]
+        line_ends.append(len(stream_text))
+
+        region_blocks = []
+        region_chs = []
         # go through datablocks until there are none left
         while True:
             ch = {}
@@ -201,40 +211,77 @@ class _ScenReader(_NonStandardEmisInReader):
             ch["todo"] = ["SET"] * len(variables)
             ch["region"] = [region] * len(variables)
 
-            region_block = StringIO()
-            for i in range(number_years):
-                region_block.write(self._stream.readline())
-            region_block.seek(0)
-
-            region_df = self._convert_data_block_to_df(region_block)
+            block_start = self._stream.tell()
+            block_last_line = bisect.bisect_right(line_ends, block_start) + (
+                number_years - 1
+            )
+            block_end = line_ends[min(block_last_line, len(line_ends) - 1)]
+            self._stream.seek(block_end)
 
-            try:
-                df = pd.concat([region_df, df], axis="columns")
-                columns = {key: ch[key] + columns[key] for key in columns}
-            except NameError:
-                df = region_df
-                columns = ch
+            region_blocks.append(stream_text[block_start:block_end])
+            region_chs.append(ch)
 
         self._stream.seek(pos_block)
 
-        try:
-            return df, columns
-        except NameError:
+        if not region_blocks:
             error_msg = (
                 "This is unexpected, please raise an issue on "
                 "https://github.com/openscm/pymagicc/issues"
             )
             raise Exception(error_msg)
 
-    def _read_notes(self):
-        notes = []
-        while True:
-            line = self._stream.readline()
-            if not line:
-                break
-            notes.append(line)
+        # the last block read comes first
+        df = self._convert_region_data_blocks_to_df(region_blocks[::-1])
+        columns = {
+            key: [v for ch in region_chs[::-1] for v in ch[key]]
+            for key in region_chs[0]
+        }
+
+        return df, columns
+
+    def _convert_region_data_blocks_to_df(self, region_blocks):
+        """
+        Convert the data blocks of each region into a single dataframe
+
+        Parameters
+        ----------
+        region_blocks : list of str
+            Data block of each region, in the order their columns should appear
 
-        return notes
+        Returns
+        -------
+        :obj:`pd.DataFrame`
+            Dataframe with the columns of each region's data block side by side
+        """
+        try:
+            # all regions normally share the same years so we can convert every
+            # block in one go and then lay the blocks side by side
+            stacked = self._convert_numeric_data_block_to_df("\n".join(region_blocks))
+            years = stacked.index.values.reshape(len(region_blocks), -1)
+            if not (years == years[0]).all():
+                raise ValueError("Region data blocks have different years")
+
+        except ValueError:
+            return pd.concat(
+                [self._convert_data_block_to_df(StringIO(b)) for b in region_blocks],
+                axis="columns",
+            )
+
+        n_years = years.shape[1]
+        data = (
+            stacked.values.reshape(len(region_blocks), n_years, -1)
+            .transpose(1, 0, 2)
+            .reshape(n_years, -1)
+        )
+        index = stacked.index[:n_years]
+        if index.dtype.kind == "f":
+            index = pd.Index(np.round(index.values, 3))
+
+        return pd.DataFrame(data, index=index)
+
+    def _read_notes(self):
+        # everything left in the stream is notes
+        return self._stream.readlines()
 
 
 class _ScenWriter(_Writer):
@@ -244,14 +291,20 @@ class _ScenWriter(_Writer):
     SCEN_VARS_CODE_1 = convert_magicc7_to_openscm_variables(
         [v + "_EMIS" for v in PART_OF_SCENFILE_WITH_EMISSIONS_CODE_1]
     )
+    _SCEN_VARS_CODE_0_SET = frozenset(SCEN_VARS_CODE_0)
+    _SCEN_VARS_CODE_1_SET = frozenset(SCEN_VARS_CODE_1)
+    _rcp_region_renames = {
+        r: r.replace("R5.2", "R5")
+        for r in ["R5.2ASIA", "R5.2LAM", "R5.2REF", "R5.2MAF", "R5.2OECD"]
+    }
 
     def write(self, magicc_input, filepath):
         orig_length = len(magicc_input)
-        orig_vars = magicc_input["variable"]
+        orig_vars = set(magicc_input["variable"])
 
-        if not (set(self.SCEN_VARS_CODE_1) - set(orig_vars)):
+        if self._SCEN_VARS_CODE_1_SET.issubset(orig_vars):
             magicc_input.filter(variable=self.SCEN_VARS_CODE_1, inplace=True)
-        elif not (set(self.SCEN_VARS_CODE_0) - set(orig_vars)):
+        elif self._SCEN_VARS_CODE_0_SET.issubset(orig_vars):
             magicc_input.filter(variable=self.SCEN_VARS_CODE_0, inplace=True)
         if len(magicc_input) != orig_length:
             warnings.warn("Ignoring input data which is not required for .SCEN file")
@@ -270,9 +323,12 @@ class _ScenWriter(_Writer):
         regions = convert_magicc_to_openscm_regions(regions, inverse=True)
         regions = self._ensure_file_region_type_consistency(regions)
 
-        special_scen_code = get_special_scen_code(regions=regions, emissions=variables)
+        # the code also determines the variable order when writing the data block
+        self._special_scen_code = get_special_scen_code(
+            regions=regions, emissions=variables
+        )
 
-        header_lines.append("{}".format(special_scen_code))
+        header_lines.append("{}".format(self._special_scen_code))
 
         # for a scen file, the convention is (although all these lines are
         # actually ignored by source so could be anything):
@@ -302,8 +358,9 @@ class _ScenWriter(_Writer):
         for k, v in self.minput.metadata.items():
             header_lines.append("{}: {}".format(k, v))
 
-        output.write(self._newline_char.join(header_lines))
-        output.write(self._newline_char)
+        # the data blocks go between the first six lines and the notes so the header
+        # is written with the data blocks
+        self._header_lines = header_lines
 
         return output
 
@@ -314,15 +371,11 @@ class _ScenWriter(_Writer):
     def _write_datablock(self, output):
         # for SCEN files, the data format is vitally important for the source code
         # we have to work out a better way of matching up all these conventions/testing them, tight coupling between pymagicc and MAGICC may solve it for us...
-        lines = output.getvalue().split(self._newline_char)
-        # notes are everything except the first 6 lines
-        number_notes_lines = len(lines) - 6
-
-        def _gip(lines, number_notes_lines):
-            """
-            Get the point where we should insert the data block.
-            """
-            return len(lines) - number_notes_lines
+        # notes are everything except the first 6 lines, the data blocks go
+        # in between
+        header_lines = self._header_lines[:6]
+        notes_lines = self._header_lines[6:] + [""]
+        region_block_lines = []
 
         region_order_db = get_region_order(
             self._get_df_header_row("region"), scen7=self._scen_7
@@ -330,8 +383,8 @@ class _ScenWriter(_Writer):
         region_order_magicc = self._ensure_file_region_type_consistency(region_order_db)
         # format is vitally important for SCEN files as far as I can tell
         time_col_length = 11
-        first_col_format_str = ("{" + ":{}d".format(time_col_length) + "}").format
-        other_col_format_str = "{:10.4f}".format
+        first_col_format = "{}d".format(time_col_length)
+        other_col_format = "10.4f"
 
         # TODO: doing it this way, out of the loop,  should ensure things
         # explode if your regions don't all have the same number of emissions
@@ -339,88 +392,96 @@ class _ScenWriter(_Writer):
         # shouldn't raise an error, another one for the future), although the
         # explosion will be cryptic so should add a test for good error
         # message at some point
-        formatters = [other_col_format_str] * (
-            int(len(self.data_block.columns) / len(region_order_db))
-            + 1  # for the years column
-        )
-        formatters[0] = first_col_format_str
-
-        variables = convert_magicc7_to_openscm_variables(
-            self._get_df_header_row("variable"), inverse=True
+        col_formats = [first_col_format] + [other_col_format] * int(
+            len(self.data_block.columns) / len(region_order_db)
         )
-        variables = _strip_emis_variables(variables)
 
-        special_scen_code = get_special_scen_code(
-            regions=region_order_magicc, emissions=variables
-        )
-        if special_scen_code % 10 == 0:
+        if self._special_scen_code % 10 == 0:
             variable_order = PART_OF_SCENFILE_WITH_EMISSIONS_CODE_0
         else:
             variable_order = PART_OF_SCENFILE_WITH_EMISSIONS_CODE_1
 
-        for region_db, region_magicc in zip(region_order_db, region_order_magicc):
-            region_block_region = convert_magicc_to_openscm_regions(region_db)
-            region_block = self.data_block.xs(
-                region_block_region, axis=1, level="region", drop_level=False
-            )
-            region_block.columns = region_block.columns.droplevel("todo")
-            region_block.columns = region_block.columns.droplevel("region")
-
-            variables = region_block.columns.levels[0]
-            variables = convert_magicc7_to_openscm_variables(variables, inverse=True)
-            region_block.columns = region_block.columns.set_levels(
-                levels=_strip_emis_variables(variables), level="variable",
-            )
-
-            region_block = region_block.reindex(
-                variable_order, axis=1, level="variable"
+        magicc6_variables = dict(
+            zip(
+                variable_order,
+                convert_magicc6_to_magicc7_variables(variable_order, inverse=True),
             )
+        )
 
-            variables = region_block.columns.get_level_values("variable").tolist()
-            variables = convert_magicc6_to_magicc7_variables(
-                [v.replace("_EMIS", "") for v in variables], inverse=True
+        columns = self.data_block.columns.droplevel("todo")
+        if not (columns.names == ["variable", "unit", "region"]):
+            raise AssertionError(
+                "Unexpected data block columns: {}".format(columns.names)
             )
 
-            units = convert_pint_to_fortran_safe_units(
-                region_block.columns.get_level_values("unit").tolist()
+        # the relabelling of the columns is the same for every region so is done once
+        # here rather than for each region block
+        variable_level = columns.levels[0].tolist()
+        scen_variables = dict(
+            zip(
+                variable_level,
+                _strip_emis_variables(
+                    convert_magicc7_to_openscm_variables(variable_level, inverse=True)
+                ),
             )
-            # column widths don't work with expressive units
-            units = [u.replace("_", "").replace("peryr", "") for u in units]
+        )
 
-            if not (region_block.columns.names == ["variable", "unit"]):
-                raise AssertionError(
-                    "Unexpected region block columns: "
-                    "{}".format(region_block.columns.names)
-                )
+        unit_level = columns.levels[columns.names.index("unit")].tolist()
+        # column widths don't work with expressive units
+        scen_units = {
+            u: fu.replace("_", "").replace("peryr", "")
+            for u, fu in zip(unit_level, convert_pint_to_fortran_safe_units(unit_level))
+        }
 
-            region_block = region_block.rename(columns=str).reset_index()
-            region_block.columns = [["YEARS"] + variables, ["Yrs"] + units]
+        # work out where each region's variables are in one pass over the columns so
+        # that each region block can be sliced straight out of the underlying array
+        col_variables = [scen_variables[v] for v in columns.get_level_values(0)]
+        col_units = [scen_units[u] for u in columns.get_level_values("unit")]
+        region_variable_positions = {}
+        for i, (variable, region) in enumerate(
+            zip(col_variables, columns.get_level_values("region"))
+        ):
+            region_variable_positions.setdefault(region, {}).setdefault(
+                variable, []
+            ).append(i)
+
+        time_values = self.data_block.index.values
+        values = self.data_block.values
 
-            region_block_str = region_magicc + self._newline_char
-            region_block_str += region_block.to_string(
-                index=False, formatters=formatters, sparsify=False
+        for region_db, region_magicc in zip(region_order_db, region_order_magicc):
+            region_block_region = convert_magicc_to_openscm_regions(region_db)
+            variable_positions = region_variable_positions[region_block_region]
+            positions = [
+                i for v in variable_order for i in variable_positions.get(v, [])
+            ]
+
+            variables = [magicc6_variables[col_variables[i]] for i in positions]
+            units = [col_units[i] for i in positions]
+
+            region_block = pd.DataFrame(values[:, positions])
+            region_block.insert(0, "YEARS", time_values)
+            region_block.columns = pd.MultiIndex.from_arrays(
+                [["YEARS"] + variables, ["Yrs"] + units]
             )
-            region_block_str += self._newline_char * 2
-
-            lines.insert(_gip(lines, number_notes_lines), region_block_str)
 
-        output.seek(0)
-        output.write(self._newline_char.join(lines))
-        return output
+            # the region name, then the block, then two blank lines, added as separate
+            # lines rather than concatenating the (potentially long) block string
+            region_block_lines += [
+                region_magicc,
+                self._format_data_block(region_block, col_formats),
+                "",
+                "",
+            ]
+
+        return self._write_lines(
+            output, header_lines + region_block_lines + notes_lines
+        )
 
     def _ensure_file_region_type_consistency(self, regions):
-        magicc7_regions_mapping = {
-            r: r.replace("R5.2", "R5")
-            for r in ["R5.2ASIA", "R5.2LAM", "R5.2REF", "R5.2MAF", "R5.2OECD"]
-        }
-
-        if not any([r in regions for r in magicc7_regions_mapping]):
+        if self._rcp_region_renames.keys().isdisjoint(regions):
             return regions
 
-        new_regions = [
-            magicc7_regions_mapping[r] if r in magicc7_regions_mapping else r
-            for r in regions
-        ]
+        new_regions = [self._rcp_region_renames.get(r, r) for r in regions]
         warn_msg = (
             "MAGICC7 RCP region naming (R5.2*) is not compatible with "
             "MAGICC6, automatically renaming to MAGICC6 compatible regions "
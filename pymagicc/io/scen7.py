@@ -5,7 +5,7 @@ from pymagicc.io.in_files import _HistEmisInWriter, _StandardEmisInReader
 
 
 class _Scen7Reader(_StandardEmisInReader):
-    _regexp_capture_variable = re.compile(r".*\_(\w*\-?\w*)\.SCEN7$")
+    _regexp_capture_variable = re.compile(r".*\_(\w*\-?\w*)\.SCEN7$", re.ASCII)
 
     def _get_variable_from_filepath(self):
         """
@@ -21,19 +21,16 @@ class _Scen7Reader(_StandardEmisInReader):
 
 class _Scen7Writer(_HistEmisInWriter):
     _scen_7 = True
+    _rcp_region_renames = {
+        r: r.replace("R5", "R5.2")
+        for r in ["R5ASIA", "R5LAM", "R5REF", "R5MAF", "R5OECD"]
+    }
 
     def _ensure_file_region_type_consistency(self, regions):
-        rcp_regions_mapping = {
-            r: r.replace("R5", "R5.2")
-            for r in ["R5ASIA", "R5LAM", "R5REF", "R5MAF", "R5OECD"]
-        }
-
-        if not any([r in regions for r in rcp_regions_mapping]):
+        if self._rcp_region_renames.keys().isdisjoint(regions):
             return regions
 
-        new_regions = [
-            rcp_regions_mapping[r] if r in rcp_regions_mapping else r for r in regions
-        ]
+        new_regions = [self._rcp_region_renames.get(r, r) for r in regions]
         warn_msg = (
             "MAGICC6 RCP region naming (R5*) is not compatible with "
             "MAGICC7, automatically renaming to MAGICC7 compatible regions "
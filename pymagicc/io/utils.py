@@ -1,3 +1,4 @@
+from functools import lru_cache
 from os.path import exists
 
 from pymagicc.definitions import (
@@ -14,21 +15,40 @@ REGIONMODE_FLAG = "THISFILE_REGIONMODE"
 """str: Flag used to indicate the file's region mode in MAGICCC"""
 
 
+def _build_dattype_regionmode_regions_index():
+    index = {}
+    for row, (dattype, regions) in DATTYPE_REGIONMODE_REGIONS[
+        [DATTYPE_FLAG.lower(), "regions"]
+    ].iterrows():
+        key = (frozenset(regions), dattype == "SCEN7")
+        if key in index:
+            raise AssertionError("Duplicate region set: {}".format(key))
+        index[key] = row
+
+    return index
+
+
+_DATTYPE_REGIONMODE_REGIONS_INDEX = _build_dattype_regionmode_regions_index()
+"""dict: Maps (frozenset of regions, is SCEN7) to a row of DATTYPE_REGIONMODE_REGIONS"""
+
+
 def _get_dattype_regionmode_regions_row(regions, scen7=False):
-    regions_unique = set(
-        [convert_magicc_to_openscm_regions(r, inverse=True) for r in set(regions)]
+    return _get_dattype_regionmode_regions_row_for_region_set(
+        frozenset(regions), bool(scen7)
     )
 
-    def find_region(x):
-        return set(x) == regions_unique
-
-    region_rows = DATTYPE_REGIONMODE_REGIONS["regions"].apply(find_region)
 
-    scen7_rows = DATTYPE_REGIONMODE_REGIONS["thisfile_dattype"] == "SCEN7"
-    dattype_rows = scen7_rows if scen7 else ~scen7_rows
+@lru_cache(maxsize=128)
+def _get_dattype_regionmode_regions_row_for_region_set(regions, scen7):
+    # writers look up the same handful of region sets over and over so we cache by
+    # the (hashable) set of regions rather than converting them on every call
+    regions_unique = frozenset(
+        [convert_magicc_to_openscm_regions(r, inverse=True) for r in regions]
+    )
 
-    region_dattype_row = region_rows & dattype_rows
-    if sum(region_dattype_row) != 1:
+    try:
+        return _DATTYPE_REGIONMODE_REGIONS_INDEX[(regions_unique, scen7)]
+    except KeyError:
         error_msg = (
             "Unrecognised regions, they must be part of "
             "pymagicc.definitions.DATTYPE_REGIONMODE_REGIONS. If that doesn't make "
@@ -37,8 +57,6 @@ def _get_dattype_regionmode_regions_row(regions, scen7=False):
         )
         raise ValueError(error_msg)
 
-    return region_dattype_row
-
 
 def get_region_order(regions, scen7=False):
     """
@@ -58,7 +76,7 @@ def get_region_order(regions, scen7=False):
         Region order expected by MAGICC for the given region set.
     """
     region_dattype_row = _get_dattype_regionmode_regions_row(regions, scen7=scen7)
-    region_order = DATTYPE_REGIONMODE_REGIONS["regions"][region_dattype_row].iloc[0]
+    region_order = DATTYPE_REGIONMODE_REGIONS.at[region_dattype_row, "regions"]
 
     return region_order
 
@@ -88,12 +106,10 @@ def get_dattype_regionmode(regions, scen7=False):
     """
     region_dattype_row = _get_dattype_regionmode_regions_row(regions, scen7=scen7)
 
-    dattype = DATTYPE_REGIONMODE_REGIONS[DATTYPE_FLAG.lower()][region_dattype_row].iloc[
-        0
+    dattype = DATTYPE_REGIONMODE_REGIONS.at[region_dattype_row, DATTYPE_FLAG.lower()]
+    regionmode = DATTYPE_REGIONMODE_REGIONS.at[
+        region_dattype_row, REGIONMODE_FLAG.lower()
     ]
-    regionmode = DATTYPE_REGIONMODE_REGIONS[REGIONMODE_FLAG.lower()][
-        region_dattype_row
-    ].iloc[0]
 
     return {DATTYPE_FLAG: dattype, REGIONMODE_FLAG: regionmode}
 
@@ -130,4 +146,6 @@ def _check_file_exists(file_to_read):
 
 
 def _strip_emis_variables(in_vars):
-    return [v.replace("T_EMIS", "").replace("_EMIS", "") for v in in_vars]
+    # variables are repeated for every region so only strip each one once
+    stripped = {v: v.replace("T_EMIS", "").replace("_EMIS", "") for v in set(in_vars)}
+    return [stripped[v] for v in in_vars]
@@ -11,7 +11,6 @@ project to make it easier for ourselves and others to re-use them.
 import datetime
 import re
 import warnings
-from copy import deepcopy
 
 
 # Thank you https://stackoverflow.com/a/15448887/10473080
@@ -178,15 +177,12 @@ def apply_string_substitutions(
         substitutions, case_insensitive=case_insensitive
     )
 
-    inputs_return = deepcopy(inputs)
-    if isinstance(inputs_return, str):
-        inputs_return = _multiple_replace(inputs_return, substitutions, compiled_regexp)
-    else:
-        inputs_return = [
-            _multiple_replace(v, substitutions, compiled_regexp) for v in inputs_return
-        ]
+    # no need to copy the inputs, strings are immutable and the list comprehension
+    # builds a new list anyway
+    if isinstance(inputs, str):
+        return _multiple_replace(inputs, substitutions, compiled_regexp)
 
-    return inputs_return
+    return [_multiple_replace(v, substitutions, compiled_regexp) for v in inputs]
 
 
 def get_date_time_string():
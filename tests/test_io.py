@@ -4,6 +4,7 @@ import re
 import shutil
 import warnings
 from copy import deepcopy
+from io import StringIO
 from os import listdir
 from os.path import basename, dirname, isfile, join
 from unittest.mock import patch
@@ -32,8 +33,9 @@ from pymagicc.io import (
     read_mag_file_metadata,
     to_int,
 )
-from pymagicc.io.base import _Reader
+from pymagicc.io.base import _Reader, _Writer
 from pymagicc.io.compact import find_parameter_groups
+from pymagicc.io.rcpdat import _RCPDatReader
 from pymagicc.io.scen import get_special_scen_code
 
 MAGICC6_DIR = pkg_resources.resource_filename("pymagicc", "MAGICC6/run")
@@ -2904,6 +2906,26 @@ def test_header_metadata():
     ) == {"compiled by": "Zebedee Nicholls, Australian-German Climate & Energy College"}
 
 
+def test_rcpdat_header_metadata():
+    m = _RCPDatReader("test")
+    assert m.process_header(
+        "RCP3PD_CONTACT: Detlef van Vuuren\n"
+        "NOTE: first line\n"
+        "   second line\n"
+        "\n"
+        "DATE: 26/11/2009 11:29:06\n"
+        "COLUMN_DESCRIPTION: ignored"
+    ) == {
+        "contact": "Detlef van Vuuren",
+        "note": ["first line", "second line"],
+        "date": "26/11/2009 11:29:06",
+    }
+    # a note can run to the end of the header
+    assert m.process_header("NOTE: first line\nsecond line") == {
+        "note": ["first line", "second line"]
+    }
+
+
 def test_magicc_input_init():
     # must init with data
     with pytest.raises(TypeError):
@@ -2949,6 +2971,94 @@ def test_set_lines_and_find_nml():
         assert reader.lines == f.readlines()
 
 
+@pytest.mark.parametrize(
+    "nml_lines",
+    [
+        [
+            " &THISFILE_SPECIFICATIONS\n",
+            " THISFILE_DATACOLUMNS    =           4,\n",
+            " THISFILE_FIRSTYEAR      =        1765,\n",
+            " THISFILE_ANNUALSTEPS    =           1,\n",
+            " THISFILE_UNITS          = 'W/m^2',\n",
+            ' THISFILE_DATTYPE        = "RCPDAT"\n',
+            " THISFILE_SCALE          = 1.5e-3\n",
+            " /\n",
+        ],
+        [
+            " &THISFILE_SPECIFICATIONS\n",
+            " THISFILE_DATACOLUMNS    =           4,\n",
+            " THISFILE_UNITS          = SEE ROW 22          ,\n",
+            " THISFILE_DATTYPE        = 'MAG'\n",
+            " /\n",
+        ],
+        [
+            " &THISFILE_SPECIFICATIONS\n",
+            " THISFILE_UNITS  = W/m^2               ,\n",
+            " THISFILE_DATTYPE        = FOURBOXDATA\n",
+            " THISFILE_FIRSTDATAROW   = 21\n",
+            " /\n",
+        ],
+        [
+            " &THISFILE_SPECIFICATIONS\n",
+            " THISFILE_UNITS          = W/m2  ,\n",
+            " THISFILE_REGIONMODE     = T\n",
+            " /\n",
+        ],
+        [
+            " &THISFILE_SPECIFICATIONS\n",
+            " THISFILE_SCALE          = Infinity\n",
+            " THISFILE_UNITS  = Mg/yr               ,\n",
+            " /\n",
+        ],
+    ],
+)
+def test_process_metadata_matches_f90nml(nml_lines):
+    reader = _Reader("test")
+    res = reader.process_metadata(nml_lines)
+    expected = reader._process_metadata_f90nml(nml_lines)
+
+    assert res == expected
+    for k, v in res.items():
+        assert type(v) is type(expected[k])
+
+
+@pytest.mark.parametrize(
+    "data_block, expected_index, expected_values",
+    [
+        ("1765 1.0 2.0\n1766 3.0 4.0", [1765, 1766], [[1.0, 2.0], [3.0, 4.0]]),
+        (
+            "1765.042 1.0 2.0\n1765.125 3.0 4.0",
+            [1765.042, 1765.125],
+            [[1.0, 2.0], [3.0, 4.0]],
+        ),
+        ("1765 1.0 2.0\n1766 3.0", [1765, 1766], [[1.0, 2.0], [3.0, np.nan]]),
+        ("1765 1.0 2.0\n1766 3.0 NA", [1765, 1766], [[1.0, 2.0], [3.0, np.nan]]),
+        (
+            "1765 1.0 2.0 3.0\n1766 4.0",
+            [1765, 1766],
+            [[1.0, 2.0, 3.0], [4.0, np.nan, np.nan]],
+        ),
+        # values are parsed exactly as ``float`` does, whether or not the block is
+        # rectangular
+        (
+            "1765 0.88819950E-31 2.0\n1766 3.0 4.0",
+            [1765, 1766],
+            [[float("0.88819950E-31"), 2.0], [3.0, 4.0]],
+        ),
+        (
+            "1765 0.88819950E-31 2.0\n1766 3.0",
+            [1765, 1766],
+            [[float("0.88819950E-31"), 2.0], [3.0, np.nan]],
+        ),
+    ],
+)
+def test_convert_data_block_to_df(data_block, expected_index, expected_values):
+    res = _Reader("test")._convert_data_block_to_df(StringIO(data_block))
+
+    exp = pd.DataFrame(expected_values, index=expected_index)
+    pd.testing.assert_frame_equal(res, exp, check_names=False, check_exact=True)
+
+
 @pytest.mark.parametrize(
     "test_filepath, expected_variable",
     [
@@ -3598,6 +3708,84 @@ def test_prn_wrong_unit_error():
         writer.write("Unused.prn", magicc_version=6)
 
 
+@pytest.mark.parametrize("scale", [1, 10 ** 3, 10 ** 6, 10 ** 12, -1])
+@pytest.mark.parametrize(
+    "columns, time, col_formats, header",
+    [
+        # prn
+        (
+            ["Years", "CFC11", "CFC12"],
+            [2000, 2001, 2002],
+            ["10d", "9.0f", "9.0f"],
+            False,
+        ),
+        (
+            ["Years", "CFC11", "CFC12"],
+            [2000, 2001, 2002],
+            ["10d", "9.3e", "9.3e"],
+            False,
+        ),
+        # scen
+        (
+            [["YEARS", "FossilCO2", "CH4"], ["Yrs", "GtC", "MtCH4"]],
+            [2000, 2001, 2002],
+            ["11d", "10.4f", "10.4f"],
+            True,
+        ),
+        (
+            [["YEARS", "FossilCO2", "AVeryLongVariableName"], ["Yrs", "GtC", "MtCH4"]],
+            [2000, 2001, 2002],
+            ["11d", "10.4f", "10.4f"],
+            True,
+        ),
+        # in files
+        (
+            [
+                ["VARIABLE", "CO2I_EMIS", "CH4_EMIS"],
+                ["TODO", "SET", "SET"],
+                ["UNITS", "GtC", "MtCH4"],
+                ["YEARS", "GLOBAL", "GLOBAL"],
+            ],
+            [2000, 2001, 2002],
+            ["11d", "19.5e", "19.5e"],
+            True,
+        ),
+        (
+            [
+                ["VARIABLE", "CO2I_EMIS", "AVeryLongVariableNameForTheHeader"],
+                ["TODO", "SET", "SET"],
+                ["UNITS", "GtC", "MtCH4"],
+                ["YEARS", "GLOBAL", "GLOBAL"],
+            ],
+            [2000.5, 2001.5, 2002.5],
+            ["11f", "19.5e", "19.5e"],
+            True,
+        ),
+    ],
+)
+def test_writer_format_data_block(columns, time, col_formats, header, scale):
+    data_block = pd.DataFrame(
+        [
+            [time[0], 6.735 * scale, 300.207 * scale],
+            [time[1], 6.896 * scale, 303.4093 * scale],
+            [time[2], 6.949 * scale, 0.001 * scale],
+        ]
+    )
+    if isinstance(columns[0], list):
+        data_block.columns = pd.MultiIndex.from_arrays(columns)
+    else:
+        data_block.columns = columns
+
+    res = _Writer._format_data_block(data_block, col_formats, header=header)
+
+    formatters = [("{:" + f + "}").format for f in col_formats]
+    exp = data_block.to_string(
+        index=False, header=header, formatters=formatters, sparsify=False
+    )
+
+    assert res == exp
+
+
 def test_compact_out_reader():
     mdata = MAGICCData(join(TEST_DATA_DIR, "COMPACT.OUT"))
 